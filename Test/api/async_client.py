@@ -0,0 +1,105 @@
+import asyncio
+import time
+
+import httpx
+
+from .cassette import AsyncCassetteTransport
+from .client import RETRY_STATUSES
+
+# Методы, которые безопасно повторять (как Retry.DEFAULT_ALLOWED_METHODS в синхронном клиенте)
+IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE", "HEAD", "OPTIONS", "TRACE"})
+
+
+class AsyncApiClient:
+    """Асинхронный HTTP-клиент Petstore API с тем же набором методов, что и ApiClient"""
+
+    # Обработчики, подписываемые на каждый создаваемый клиент (например, профилировщиком на время сессии)
+    default_listeners = []
+
+    def __init__(self, base_url, pool_size=10, retries=3, backoff_factor=0.3, timeout=10.0, cassette=None):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        # Обработчики вызываются после каждого запроса: listener(method, path, response, elapsed)
+        self.listeners = list(self.default_listeners)
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        )
+        if cassette is not None:
+            transport = AsyncCassetteTransport(cassette, transport)
+        self.client = httpx.AsyncClient(timeout=timeout, transport=transport)
+
+    def url(self, path):
+        """Полный URL для пути относительно BASE_URL"""
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    async def request(self, method, path, **kwargs):
+        response = None
+        events = {}
+
+        async def trace(event_name, info):
+            # Имена событий httpcore без префикса протокола: "connect_tcp.started", "receive_response_headers.complete"
+            events[event_name.split(".", 1)[1]] = time.perf_counter()
+
+        kwargs["extensions"] = {**kwargs.get("extensions", {}), "trace": trace}
+        start = time.perf_counter()
+        try:
+            response = await self._send(method, path, **kwargs)
+            return response
+        finally:
+            elapsed = time.perf_counter() - start
+            if response is not None:
+                response.timing = self.timing(response, elapsed, events)
+            for listener in self.listeners:
+                listener(method, path, response, elapsed)
+
+    async def _send(self, method, path, **kwargs):
+        if isinstance(kwargs.get("params"), dict):
+            # Как и requests, не передаём параметры со значением None
+            kwargs["params"] = {key: value for key, value in kwargs["params"].items() if value is not None}
+        attempts = self.retries + 1 if method in IDEMPOTENT_METHODS else 1
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            try:
+                response = await self.client.request(method, self.url(path), **kwargs)
+            except httpx.TransportError:
+                if last_attempt:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUSES or last_attempt:
+                    return response
+            await asyncio.sleep(self.backoff_factor * 2 ** attempt)
+
+    @staticmethod
+    def timing(response, elapsed, events):
+        """Фазы запроса в миллисекундах и размеры тел запроса и ответа в байтах"""
+        def phase(started, complete):
+            if started in events and complete in events:
+                return (events[complete] - events[started]) * 1000
+            return 0.0
+
+        return {
+            # httpcore разрешает имя внутри connect_tcp, отдельно DNS не замерить
+            "dns_ms": None,
+            "connect_ms": phase("connect_tcp.started", "connect_tcp.complete"),
+            "ttfb_ms": phase("send_request_headers.started", "receive_response_headers.complete"),
+            "total_ms": elapsed * 1000,
+            "request_bytes": len(response.request.content),
+            "response_bytes": len(response.content)
+        }
+
+    async def get(self, path, **kwargs):
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path, **kwargs):
+        return await self.request("POST", path, **kwargs)
+
+    async def put(self, path, **kwargs):
+        return await self.request("PUT", path, **kwargs)
+
+    async def delete(self, path, **kwargs):
+        return await self.request("DELETE", path, **kwargs)
+
+    async def close(self):
+        await self.client.aclose()
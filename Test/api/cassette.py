@@ -0,0 +1,148 @@
+import base64
+import gzip
+import hashlib
+import io
+import json
+import os
+import threading
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import httpx
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
+
+# Заголовки ответа, которые сохраняются в кассете; остальные (Date, Server, ...) на проверки не влияют.
+# Тело записывается уже раскодированным, поэтому Content-Length вычисляется заново при воспроизведении
+RECORDED_HEADERS = ("content-type",)
+
+
+class CassetteMiss(LookupError):
+    """В кассете нет записанного ответа на запрос"""
+
+
+def current_test():
+    """ID текущего теста из PYTEST_CURRENT_TEST; пустая строка вне теста"""
+    value = os.environ.get("PYTEST_CURRENT_TEST", "")
+    return value.rsplit(" ", 1)[0] if value else ""
+
+
+def interaction_key(method, url, body):
+    """Ключ запроса: метод, путь, отсортированные параметры и хэш тела; хост и порт не учитываются"""
+    parts = urlsplit(str(url))
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    if isinstance(body, str):
+        body = body.encode()
+    if body:
+        try:
+            body = json.dumps(json.loads(body), sort_keys=True, separators=(",", ":")).encode()
+        except ValueError:
+            pass
+        query += "#" + hashlib.sha256(body).hexdigest()[:16]
+    return f"{method} {parts.path}?{query}"
+
+
+class Cassette:
+    """Записанные ответы API, сгруппированные по тестам и ключам запросов
+
+    Повторяющиеся запросы (например, GET питомца до и после удаления) воспроизводятся в порядке записи.
+    """
+
+    def __init__(self, path, mode="replay", replay_paths=None):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Неизвестный режим кассеты: {mode}")
+        self.path = path
+        self.mode = mode
+        self.interactions = {}
+        self._cursors = {}
+        self._lock = threading.Lock()
+        if mode == "replay":
+            # Кассеты воркеров xdist можно объединить: ответы в них сгруппированы по тестам
+            for replay_path in replay_paths or [path]:
+                with gzip.open(replay_path, "rt", encoding="utf-8") as file:
+                    self.interactions.update(json.load(file)["interactions"])
+
+    @property
+    def recording(self):
+        return self.mode == "record"
+
+    def record(self, method, url, body, status, headers, content):
+        key = interaction_key(method, url, body)
+        try:
+            entry = {"body": content.decode("utf-8")}
+        except UnicodeDecodeError:
+            entry = {"body_base64": base64.b64encode(content).decode()}
+        entry["status"] = status
+        entry["headers"] = {name: value for name, value in headers.items() if name.lower() in RECORDED_HEADERS}
+        with self._lock:
+            self.interactions.setdefault(current_test(), {}).setdefault(key, []).append(entry)
+
+    def play(self, method, url, body):
+        """Статус, заголовки и тело следующего записанного ответа на запрос"""
+        key = interaction_key(method, url, body)
+        test = current_test()
+        with self._lock:
+            responses = self.interactions.get(test, {}).get(key)
+            if responses is None:
+                raise CassetteMiss(f"Нет записанного ответа на {key} в тесте {test or '<вне теста>'}")
+            cursor = self._cursors.get((test, key), 0)
+            if cursor >= len(responses):
+                raise CassetteMiss(f"Записанные ответы на {key} в тесте {test or '<вне теста>'} закончились")
+            self._cursors[(test, key)] = cursor + 1
+        entry = responses[cursor]
+        if "body_base64" in entry:
+            content = base64.b64decode(entry["body_base64"])
+        else:
+            content = entry["body"].encode("utf-8")
+        return entry["status"], {**entry["headers"], "Content-Length": str(len(content))}, content
+
+    def save(self):
+        if not self.recording:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with gzip.open(self.path, "wt", encoding="utf-8") as file:
+            json.dump({"version": 1, "interactions": self.interactions}, file, separators=(",", ":"))
+
+
+class CassetteAdapter(HTTPAdapter):
+    """Транспорт requests: записывает ответы адаптера adapter или воспроизводит их из кассеты"""
+
+    def __init__(self, cassette, adapter):
+        super().__init__()
+        self.cassette = cassette
+        self.adapter = adapter
+
+    def send(self, request, **kwargs):
+        if self.cassette.recording:
+            response = self.adapter.send(request, **kwargs)
+            self.cassette.record(request.method, request.url, request.body, response.status_code,
+                                 response.headers, response.content)
+            return response
+        status, headers, content = self.cassette.play(request.method, request.url, request.body)
+        raw = HTTPResponse(body=io.BytesIO(content), headers=headers, status=status,
+                           preload_content=False, decode_content=False)
+        return self.build_response(request, raw)
+
+    def close(self):
+        self.adapter.close()
+
+
+class AsyncCassetteTransport(httpx.AsyncBaseTransport):
+    """Транспорт httpx: записывает ответы transport или воспроизводит их из кассеты"""
+
+    def __init__(self, cassette, transport):
+        self.cassette = cassette
+        self.transport = transport
+
+    async def handle_async_request(self, request):
+        body = await request.aread()
+        if self.cassette.recording:
+            response = await self.transport.handle_async_request(request)
+            content = await response.aread()
+            self.cassette.record(request.method, request.url, body, response.status_code,
+                                 response.headers, content)
+            return response
+        status, headers, content = self.cassette.play(request.method, request.url, body)
+        return httpx.Response(status, headers=headers, content=content)
+
+    async def aclose(self):
+        await self.transport.aclose()
@@ -0,0 +1,109 @@
+import re
+import time
+
+import requests
+from urllib3.util.retry import Retry
+
+from .cassette import CassetteAdapter
+from .instrumentation import TimedHTTPAdapter, body_size, connection_phases, reset_connection_phases
+
+# Коды ответа, при которых запрос повторяется
+RETRY_STATUSES = (502, 503, 504)
+# Числовой сегмент пути, заменяемый на {id} в имени эндпоинта
+ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_name(method, path):
+    """Имя эндпоинта без конкретных ID, например 'GET /pet/{id}'"""
+    template = ID_SEGMENT.sub("/{id}", "/" + path.strip("/"))
+    return f"{method} {template}"
+
+
+class ApiClient:
+    """HTTP-клиент Petstore API с пулом keep-alive соединений"""
+
+    # Обработчики, подписываемые на каждый создаваемый клиент (например, профилировщиком на время сессии)
+    default_listeners = []
+
+    def __init__(self, base_url, pool_size=10, retries=3, backoff_factor=0.3, timeout=10.0, cassette=None):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        # Обработчики вызываются после каждого запроса: listener(method, path, response, elapsed)
+        # response равен None, если запрос завершился исключением
+        self.listeners = list(self.default_listeners)
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            raise_on_status=False
+        )
+        self._adapter = TimedHTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        # С кассетой запросы записываются через пул соединений или воспроизводятся без сети
+        adapter = CassetteAdapter(cassette, self._adapter) if cassette is not None else self._adapter
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def url(self, path):
+        """Полный URL для пути относительно BASE_URL"""
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def request(self, method, path, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        response = None
+        reset_connection_phases()
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, self.url(path), **kwargs)
+            return response
+        finally:
+            elapsed = time.perf_counter() - start
+            if response is not None:
+                response.timing = self.timing(response, elapsed, streamed=kwargs.get("stream", False))
+            for listener in self.listeners:
+                listener(method, path, response, elapsed)
+
+    @staticmethod
+    def timing(response, elapsed, streamed=False):
+        """Фазы запроса в миллисекундах и размеры тел запроса и ответа в байтах"""
+        dns, connect = connection_phases()
+        return {
+            "dns_ms": dns * 1000,
+            "connect_ms": connect * 1000,
+            "ttfb_ms": response.elapsed.total_seconds() * 1000,
+            "total_ms": elapsed * 1000,
+            "request_bytes": body_size(response.request.body),
+            # При stream=True тело ещё не прочитано, поэтому размер берётся из заголовка
+            "response_bytes": int(response.headers.get("Content-Length", 0)) if streamed else len(response.content)
+        }
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    def connection_stats(self):
+        """Статистика пула: сколько запросов отправлено и сколько соединений открыто"""
+        pools = self._adapter.poolmanager.pools
+        requests_sent = 0
+        connections = 0
+        for key in pools.keys():
+            pool = pools[key]
+            requests_sent += pool.num_requests
+            connections += pool.num_connections
+        return {
+            "requests": requests_sent,
+            "connections": connections,
+            "reused": requests_sent - connections
+        }
+
+    def close(self):
+        self.session.close()
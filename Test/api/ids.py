@@ -0,0 +1,59 @@
+import hashlib
+import itertools
+import os
+import threading
+
+# ID ниже BASE_ID не выдаются: ими пользуются проверки несуществующих сущностей (например, 9999)
+BASE_ID = 100_000
+WORKER_BLOCK_SIZE = 10_000_000
+TEST_BLOCK_SIZE = 1_000
+# Детерминированные диапазоны тестов (IdAllocator.for_test) лежат выше диапазонов воркеров
+TEST_SLOTS_OFFSET = 1_000 * WORKER_BLOCK_SIZE
+TEST_SLOTS = 2 ** 32
+
+
+def worker_index():
+    """Номер воркера pytest-xdist (gw0, gw1, ...) или 0 при запуске в одном процессе"""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    return int(worker.removeprefix("gw") or 0)
+
+
+class IdAllocator:
+    """Выдаёт уникальные ID из закреплённого диапазона [start, stop)"""
+
+    def __init__(self, start, stop):
+        self.start = start
+        self.stop = stop
+        self._counter = itertools.count(start)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_worker(cls, index=None, base=BASE_ID, block_size=WORKER_BLOCK_SIZE):
+        """Аллокатор диапазона, не пересекающегося с диапазонами других воркеров"""
+        index = worker_index() if index is None else index
+        start = base + index * block_size
+        return cls(start, start + block_size)
+
+    @classmethod
+    def for_test(cls, nodeid, base=BASE_ID, block_size=TEST_BLOCK_SIZE):
+        """Аллокатор диапазона, зависящего только от ID теста: при каждом запуске тест получает те же ID"""
+        slot = int.from_bytes(hashlib.sha256(nodeid.encode()).digest()[:4], "big") % TEST_SLOTS
+        start = base + TEST_SLOTS_OFFSET + slot * block_size
+        return cls(start, start + block_size)
+
+    def _take(self, size):
+        with self._lock:
+            first = next(self._counter)
+            if size > 1:
+                self._counter = itertools.count(first + size)
+        if first + size > self.stop:
+            raise RuntimeError(f"Диапазон ID [{self.start}, {self.stop}) исчерпан")
+        return first
+
+    def next_id(self):
+        return self._take(1)
+
+    def allocate(self, size=TEST_BLOCK_SIZE):
+        """Дочерний аллокатор на отдельный поддиапазон, например на один тест"""
+        start = self._take(size)
+        return IdAllocator(start, start + size)
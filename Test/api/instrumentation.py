@@ -0,0 +1,85 @@
+import socket
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError
+from urllib3.util.connection import allowed_gai_family
+
+# Фазы установки соединения для запроса, выполняемого в текущем потоке
+_connection_phases = threading.local()
+
+
+def reset_connection_phases():
+    _connection_phases.dns = 0.0
+    _connection_phases.connect = 0.0
+
+
+def connection_phases():
+    """Время DNS и установки TCP-соединения; 0, если соединение взято из пула"""
+    return getattr(_connection_phases, "dns", 0.0), getattr(_connection_phases, "connect", 0.0)
+
+
+class TimedConnectionMixin:
+    """Отдельно замеряет разрешение имени и установку TCP-соединения"""
+
+    def _new_conn(self):
+        dns_host = self._dns_host
+        start = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(dns_host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        except socket.gaierror:
+            # Ошибку разрешения имени поднимет urllib3 в super()._new_conn()
+            addresses = []
+        resolved = time.perf_counter()
+        # Адреса перебираются по порядку, как в urllib3: если первый (например, ::1) недоступен, пробуется следующий
+        hosts = list(dict.fromkeys(address[4][0] for address in addresses)) or [dns_host]
+        try:
+            for index, host in enumerate(hosts):
+                self._dns_host = host
+                try:
+                    sock = super()._new_conn()
+                    break
+                except ConnectTimeoutError:
+                    if index == len(hosts) - 1:
+                        raise
+        finally:
+            self._dns_host = dns_host
+        _connection_phases.dns = resolved - start
+        _connection_phases.connect = time.perf_counter() - resolved
+        return sock
+
+
+class TimedHTTPConnection(TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter, соединения которого сообщают время DNS и connect"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool
+        }
+
+
+def body_size(body):
+    if body is None:
+        return 0
+    return len(body.encode() if isinstance(body, str) else body)
@@ -0,0 +1,63 @@
+from contextlib import asynccontextmanager, contextmanager
+
+
+def pet_payload(pet_id, name="Buddy", status="available"):
+    return {
+        "id": pet_id,
+        "name": name,
+        "status": status
+    }
+
+
+def order_payload(order_id, pet_id, quantity=1, status="placed", complete=True):
+    return {
+        "id": order_id,
+        "petId": pet_id,
+        "quantity": quantity,
+        "status": status,
+        "complete": complete
+    }
+
+
+@contextmanager
+def created_pet(client, payload):
+    """Создаёт питомца и удаляет его при выходе из контекста"""
+    response = client.post("/pet", json=payload)
+    assert response.status_code == 200
+    try:
+        yield response.json()
+    finally:
+        client.delete(f"/pet/{payload['id']}")
+
+
+@contextmanager
+def created_order(client, payload):
+    """Размещает заказ и удаляет его при выходе из контекста"""
+    response = client.post("/store/order", json=payload)
+    assert response.status_code == 200
+    try:
+        yield response.json()
+    finally:
+        client.delete(f"/store/order/{payload['id']}")
+
+
+@asynccontextmanager
+async def async_created_pet(client, payload):
+    """Асинхронный вариант created_pet"""
+    response = await client.post("/pet", json=payload)
+    assert response.status_code == 200
+    try:
+        yield response.json()
+    finally:
+        await client.delete(f"/pet/{payload['id']}")
+
+
+@asynccontextmanager
+async def async_created_order(client, payload):
+    """Асинхронный вариант created_order"""
+    response = await client.post("/store/order", json=payload)
+    assert response.status_code == 200
+    try:
+        yield response.json()
+    finally:
+        await client.delete(f"/store/order/{payload['id']}")
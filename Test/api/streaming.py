@@ -0,0 +1,84 @@
+import codecs
+import json
+import re
+
+# Размер куска тела ответа, читаемого из сокета за раз
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+# Литералы и хвост числа, которые может обрезать граница куска
+_LITERALS = ("true", "false", "null", "NaN", "Infinity", "-Infinity")
+_NUMBER_TAIL = re.compile(r"[-+.eE0-9]+")
+_ESCAPE_PREFIX = re.compile(r"u[0-9a-fA-F]{0,4}")
+
+
+def _incomplete(buffer, error):
+    """Ошибка разбора вызвана тем, что элемент обрезан концом буфера, а не тем, что он некорректен"""
+    if error.msg.startswith("Unterminated string"):
+        return True
+    rest = buffer[error.pos:].lstrip(_WHITESPACE)
+    if error.msg.startswith("Invalid \\uXXXX escape"):
+        return _ESCAPE_PREFIX.fullmatch(rest) is not None
+    return (not rest or any(literal.startswith(rest) for literal in _LITERALS)
+            or _NUMBER_TAIL.fullmatch(rest) is not None)
+
+
+def iter_json_array(chunks):
+    """Элементы JSON-массива по мере поступления кусков тела ответа
+
+    В памяти держится только ещё не разобранный хвост, поэтому она не растёт с размером ответа.
+    ValueError, если тело не JSON-массив или обрывается, и сразу же - на некорректном элементе.
+    """
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buffer = ""
+    position = 0
+    finished = False
+    state = "start"  # start -> first -> separator -> value -> separator ... -> end
+
+    while True:
+        while position < len(buffer) and buffer[position] in _WHITESPACE:
+            position += 1
+        char = buffer[position] if position < len(buffer) else None
+        value = None
+        if char is not None and state in ("first", "value") and char != "]":
+            try:
+                value, end = _decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError as error:
+                # Ждём следующий кусок, только если элемент обрезан; некорректный элемент - ошибка сразу
+                if finished or not _incomplete(buffer, error):
+                    raise ValueError(f"Некорректный элемент JSON-массива: {error}") from error
+                end = None
+            # Элемент считается полным, когда за ним виден ',' или ']': число "1." в конце куска
+            # ещё может оказаться началом "1.5e3"
+            following = buffer[end:].lstrip(_WHITESPACE) if end is not None else ""
+            if end is not None and (finished or following[:1] in (",", "]")):
+                position = end
+                state = "separator"
+                yield value
+                continue
+            if following and not _NUMBER_TAIL.fullmatch(following):
+                raise ValueError(f"Неожиданный символ {following[0]!r} после элемента JSON-массива")
+        elif char is not None:
+            position += 1
+            if state == "start":
+                if char != "[":
+                    raise ValueError("Ответ не является JSON-массивом")
+                state = "first"
+            elif state in ("first", "separator") and char == "]":
+                state = "end"
+            elif state == "separator" and char == ",":
+                state = "value"
+            else:
+                raise ValueError(f"Неожиданный символ {char!r} в JSON-массиве")
+            continue
+        if finished:
+            break
+        chunk = next(chunks, None)
+        finished = chunk is None
+        buffer = buffer[position:] + text_decoder.decode(chunk or b"", final=finished)
+        position = 0
+
+    if state != "end":
+        raise ValueError("JSON-массив оборвался")
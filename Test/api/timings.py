@@ -0,0 +1,63 @@
+import csv
+import json
+import os
+import threading
+import time
+
+import allure
+
+from .client import endpoint_name
+
+TIMING_FIELDS = ("dns_ms", "connect_ms", "ttfb_ms", "total_ms", "request_bytes", "response_bytes")
+
+
+class TimingRecorder:
+    """Прикрепляет тайминги запросов к шагам Allure и пишет их в JSONL/CSV файл"""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.current_test = None
+        self._lock = threading.Lock()
+        self._file = None
+        self._csv = None
+        if path:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._file = open(path, "w", encoding="utf-8", newline="")
+            if str(path).endswith(".csv"):
+                self._csv = csv.DictWriter(self._file, fieldnames=self.fieldnames())
+                self._csv.writeheader()
+
+    @staticmethod
+    def fieldnames():
+        return ("timestamp", "test", "endpoint", "method", "path", "status") + TIMING_FIELDS
+
+    def record(self, method, path, response, elapsed):
+        """Listener для ApiClient/AsyncApiClient"""
+        timing = getattr(response, "timing", None)
+        if timing is None:
+            return
+        row = {
+            "timestamp": time.time(),
+            "test": self.current_test,
+            "endpoint": endpoint_name(method, path),
+            "method": method,
+            "path": path,
+            "status": response.status_code,
+            **timing
+        }
+        allure.attach(
+            json.dumps(row, indent=2, ensure_ascii=False),
+            name=f"Тайминги {row['endpoint']}",
+            attachment_type=allure.attachment_type.JSON
+        )
+        if self._file is None:
+            return
+        with self._lock:
+            if self._csv is not None:
+                self._csv.writerow(row)
+            else:
+                self._file.write(json.dumps(row) + "\n")
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
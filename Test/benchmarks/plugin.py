@@ -0,0 +1,118 @@
+import os
+
+import pytest
+
+from ..api.client import ApiClient
+from ..stub.petstore_server import PetstoreServer
+from .runner import BaselineStore, BenchmarkSession
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+benchmark_session_key = pytest.StashKey[BenchmarkSession]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark", "Бенчмарки эндпоинтов")
+    group.addoption("--benchmark", action="store_true",
+                    help="Запустить бенчмарки (по умолчанию они пропускаются). Без --base-url замеры идут "
+                         "на локальном Petstore API")
+    group.addoption("--benchmark-iterations", type=int, default=50,
+                    help="Количество замеряемых вызовов эндпоинта")
+    group.addoption("--benchmark-warmup", type=int, default=5,
+                    help="Количество прогревочных вызовов перед замером")
+    group.addoption("--benchmark-threshold", type=float, default=0.25,
+                    help="Допустимый относительный рост медианы латентности (0.25 = +25%%)")
+    group.addoption("--benchmark-min-delta-ms", type=float, default=0.5,
+                    help="Рост медианы в миллисекундах, который не считается регрессией")
+    group.addoption("--benchmark-baseline", default=DEFAULT_BASELINE,
+                    help="Файл с эталонными результатами")
+    group.addoption("--benchmark-save", action="store_true",
+                    help="Записать результаты прогона в файл эталона")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: замер латентности эндпоинта, запускается с --benchmark")
+    # Параллельные воркеры искажают замеры друг друга, а каждый из них перезаписывал бы эталон своими результатами
+    if config.getoption("--benchmark") and (hasattr(config, "workerinput")
+                                            or getattr(config.option, "dist", "no") != "no"):
+        raise pytest.UsageError("--benchmark нельзя запускать под xdist: уберите -n/--dist")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="Бенчмарки запускаются с --benchmark")
+    for item in items:
+        if item.get_closest_marker("benchmark"):
+            item.add_marker(skip)
+
+
+def benchmark_target(config):
+    """Ключ эталона: "local" для локального Petstore API или базовый URL реального хоста"""
+    if config.getoption("--local-server") or not config.getoption("--base-url"):
+        return "local"
+    return config.getoption("--base-url")
+
+
+@pytest.fixture(scope="session")
+def benchmark_client(pytestconfig, request):
+    """Фикстура клиента для бенчмарков: отдельный локальный Petstore API, если хост не задан явно"""
+    if pytestconfig.getoption("--local-server") or pytestconfig.getoption("--base-url"):
+        yield request.getfixturevalue("api_client")
+        return
+    server = PetstoreServer().start()
+    client = ApiClient(server.base_url, timeout=pytestconfig.getoption("--api-timeout"))
+    yield client
+    client.close()
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def benchmark_session(pytestconfig):
+    """Фикстура сравнения замеров с эталоном; с --benchmark-save результаты записываются в эталон"""
+    session = BenchmarkSession(
+        BaselineStore(pytestconfig.getoption("--benchmark-baseline")),
+        benchmark_target(pytestconfig),
+        threshold=pytestconfig.getoption("--benchmark-threshold"),
+        min_delta_ms=pytestconfig.getoption("--benchmark-min-delta-ms"),
+        iterations=pytestconfig.getoption("--benchmark-iterations"),
+        warmup=pytestconfig.getoption("--benchmark-warmup")
+    )
+    pytestconfig.stash[benchmark_session_key] = session
+    yield session
+    if pytestconfig.getoption("--benchmark-save"):
+        session.save_baseline()
+
+
+@pytest.fixture(scope="function")
+def benchmark_ids(id_allocator, benchmark_session):
+    """Фикстура диапазона ID бенчмарка: эндпоинты вроде DELETE /pet/{id} тратят ID на каждый вызов"""
+    return id_allocator.allocate(benchmark_session.warmup + benchmark_session.iterations + 8)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    session = config.stash.get(benchmark_session_key, None)
+    if session is None or not session.results:
+        return
+    terminalreporter.write_sep("-", f"benchmarks ({session.target})")
+    terminalreporter.write_line(
+        f"{'endpoint':<28}{'median ms':>11}{'mad ms':>9}{'p95 ms':>9}{'baseline ms':>13}{'change':>9}"
+    )
+    for name, result in session.results.items():
+        baseline = session.store.get(session.target, name)
+        if baseline:
+            change = f"{result['median_ms'] / baseline['median_ms'] - 1:+.0%}"
+            baseline_median = f"{baseline['median_ms']:.2f}"
+        else:
+            change = baseline_median = "-"
+        terminalreporter.write_line(
+            f"{name:<28}{result['median_ms']:>11.2f}{result['mad_ms']:>9.2f}{result['p95_ms']:>9.2f}"
+            f"{baseline_median:>13}{change:>9}"
+        )
+    if config.getoption("--benchmark-save"):
+        terminalreporter.write_line(f"baseline saved to {session.store.path}")
+    elif not session.store.data.get(session.target):
+        terminalreporter.write_line(
+            f"no baseline for {session.target} in {session.store.path}: regressions are not checked, "
+            f"record one with --benchmark-save"
+        )
@@ -0,0 +1,101 @@
+import json
+import os
+import statistics
+import time
+
+from ..load.runner import percentile
+
+
+def measure(call, iterations=50, warmup=5, setup=None):
+    """Время выполнения call() в миллисекундах после warmup прогревочных вызовов
+
+    setup(i) вызывается перед каждым вызовом и не входит в замер; его результат передаётся в call.
+    """
+    for index in range(warmup):
+        call(setup(index) if setup else None)
+    samples = []
+    for index in range(iterations):
+        argument = setup(warmup + index) if setup else None
+        start = time.perf_counter()
+        call(argument)
+        samples.append((time.perf_counter() - start) * 1000)
+    return summarize(samples)
+
+
+def summarize(samples):
+    """Устойчивые к выбросам характеристики выборки: медиана, MAD, межквартильный размах"""
+    ordered = sorted(samples)
+    median = statistics.median(ordered)
+    return {
+        "iterations": len(ordered),
+        "median_ms": median,
+        "mad_ms": statistics.median(abs(value - median) for value in ordered),
+        "iqr_ms": percentile(ordered, 75) - percentile(ordered, 25),
+        "p95_ms": percentile(ordered, 95),
+        "min_ms": ordered[0]
+    }
+
+
+class BaselineStore:
+    """Файл с эталонными результатами, сгруппированными по целевому хосту"""
+
+    def __init__(self, path):
+        self.path = path
+        self.data = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                self.data = json.load(file)
+
+    def get(self, target, name):
+        return self.data.get(target, {}).get(name)
+
+    def update(self, target, results):
+        self.data.setdefault(target, {}).update(results)
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump(self.data, file, indent=2, sort_keys=True)
+            file.write("\n")
+
+
+def regression(result, baseline, threshold, min_delta_ms):
+    """Описание регрессии медианы относительно эталона или None, если её нет
+
+    Отклонение засчитывается, только если оно больше threshold в относительном выражении,
+    больше min_delta_ms и больше трёх MAD эталона: это отсекает шум на быстрых эндпоинтах.
+    """
+    if baseline is None:
+        return None
+    delta = result["median_ms"] - baseline["median_ms"]
+    allowed = max(baseline["median_ms"] * threshold, min_delta_ms, 3 * baseline.get("mad_ms", 0))
+    if delta <= allowed:
+        return None
+    return (
+        f"median {result['median_ms']:.2f} ms vs baseline {baseline['median_ms']:.2f} ms "
+        f"(+{delta / baseline['median_ms']:.0%}, allowed +{allowed:.2f} ms)"
+    )
+
+
+class BenchmarkSession:
+    """Сравнивает результаты замеров с эталоном и копит их для отчёта и сохранения"""
+
+    def __init__(self, store, target, threshold=0.25, min_delta_ms=0.5, iterations=50, warmup=5):
+        self.store = store
+        self.target = target
+        self.threshold = threshold
+        self.min_delta_ms = min_delta_ms
+        self.iterations = iterations
+        self.warmup = warmup
+        self.results = {}
+
+    def measure(self, call, setup=None):
+        return measure(call, iterations=self.iterations, warmup=self.warmup, setup=setup)
+
+    def check(self, name, result):
+        self.results[name] = result
+        return regression(result, self.store.get(self.target, name), self.threshold, self.min_delta_ms)
+
+    def save_baseline(self):
+        self.store.update(self.target, self.results)
+        self.store.save()
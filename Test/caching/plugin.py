@@ -0,0 +1,141 @@
+import hashlib
+import inspect
+import time
+
+import pytest
+
+CACHE_KEY = "petstore/result_cache"
+
+result_cache_key = pytest.StashKey["ResultCache"]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("result-cache", "Кэш результатов идемпотентных проверок")
+    group.addoption("--result-cache", action="store_true",
+                    help="Пропускать тесты с маркером idempotent, если они уже проходили на той же "
+                         "версии API и с тем же исходным кодом теста")
+    group.addoption("--result-cache-ttl", type=float, default=24 * 60 * 60,
+                    help="Время жизни записи кэша в секундах")
+    group.addoption("--result-cache-max-entries", type=int, default=1000,
+                    help="Максимальное количество записей; самые старые вытесняются")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "idempotent: результат теста определяется версией API и кодом теста; с --result-cache "
+        "успешный результат переиспользуется"
+    )
+    if config.getoption("--result-cache") and config.cache is not None and not is_xdist_controller(config):
+        config.stash[result_cache_key] = ResultCache(
+            config.cache.get(CACHE_KEY, {}),
+            ttl=config.getoption("--result-cache-ttl"),
+            max_entries=config.getoption("--result-cache-max-entries")
+        )
+
+
+def is_xdist_controller(config):
+    """Контроллер xdist сам тесты не выполняет: кэш читают и пополняют только воркеры"""
+    return not hasattr(config, "workerinput") and getattr(config.option, "dist", "no") != "no"
+
+
+class ResultCache:
+    """Успешные результаты тестов по ключу (отпечаток API, ID теста, хэш исходного кода)"""
+
+    def __init__(self, entries, ttl, max_entries):
+        self.entries = entries
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.fingerprint = None
+        self.hits = 0
+        # Записи этого процесса; при сохранении они сливаются с тем, что успели записать другие воркеры
+        self.new_entries = {}
+
+    @staticmethod
+    def test_hash(item):
+        source = inspect.getsource(item.function)
+        params = repr(sorted(item.callspec.params.items())) if hasattr(item, "callspec") else ""
+        return hashlib.sha256(f"{item.nodeid}\n{params}\n{source}".encode()).hexdigest()[:16]
+
+    def key(self, item):
+        return f"{self.fingerprint}:{item.nodeid}:{self.test_hash(item)}"
+
+    def lookup(self, item, now=None):
+        entry = self.entries.get(self.key(item))
+        if entry is None or (now or time.time()) - entry["time"] > self.ttl:
+            return None
+        return entry
+
+    @property
+    def stored(self):
+        return len(self.new_entries)
+
+    def store(self, item, duration):
+        self.new_entries[self.key(item)] = {"outcome": "passed", "duration": duration, "time": time.time()}
+
+    def merged(self, entries, now=None):
+        """Записи entries с добавленными записями этого процесса без просроченных и самых старых сверх max_entries"""
+        now = now or time.time()
+        entries = {**entries, **self.new_entries}
+        alive = [(key, entry) for key, entry in entries.items() if now - entry["time"] <= self.ttl]
+        alive.sort(key=lambda pair: pair[1]["time"], reverse=True)
+        return dict(alive[:self.max_entries])
+
+
+def api_fingerprint(client):
+    """Хэш описания API (/openapi.json): меняется вместе с версией сервера; None, если описание недоступно"""
+    try:
+        response = client.get("/openapi.json")
+    except Exception:
+        return None
+    if response.status_code != 200:
+        return None
+    return hashlib.sha256(response.content).hexdigest()[:16]
+
+
+@pytest.fixture(autouse=True)
+def cached_result(request, pytestconfig):
+    """Фикстура, пропускающая идемпотентный тест, если его успешный результат есть в кэше"""
+    cache = pytestconfig.stash.get(result_cache_key, None)
+    if cache is None or request.node.get_closest_marker("idempotent") is None:
+        return
+    if cache.fingerprint is None:
+        cache.fingerprint = api_fingerprint(request.getfixturevalue("api_client")) or ""
+    if not cache.fingerprint:
+        return
+    entry = cache.lookup(request.node)
+    if entry is not None:
+        cache.hits += 1
+        cached_at = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(entry["time"]))
+        pytest.skip(f"cached: {entry['outcome']} at {cached_at} in {entry['duration']:.3f} s "
+                    f"(API {cache.fingerprint})")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    cache = item.config.stash.get(result_cache_key, None)
+    if (cache is not None and cache.fingerprint and report.when == "call" and report.passed
+            and item.get_closest_marker("idempotent") is not None):
+        cache.store(item, report.duration)
+
+
+def pytest_sessionfinish(session):
+    cache = session.config.stash.get(result_cache_key, None)
+    if cache is not None and cache.new_entries:
+        # Перечитываем кэш перед записью: другие воркеры могли сохранить свои результаты раньше
+        session.config.cache.set(CACHE_KEY, cache.merged(session.config.cache.get(CACHE_KEY, {})))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    cache = config.stash.get(result_cache_key, None)
+    if cache is None:
+        return
+    terminalreporter.write_sep("-", "result cache")
+    if not cache.fingerprint:
+        terminalreporter.write_line("API fingerprint unavailable (/openapi.json), cache not used")
+        return
+    terminalreporter.write_line(
+        f"API {cache.fingerprint}: {cache.hits} tests skipped with cached results, {cache.stored} results stored"
+    )
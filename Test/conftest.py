@@ -1,32 +1,253 @@
+import glob
+import os
+from contextlib import ExitStack
+
 import pytest
-import requests
-
-BASE_URL = "http://5.181.109.28:9090/api/v3"
-
-
-@pytest.fixture(scope="function")  # scope - это область видимости
-def create_pet():
-    """"Фикстура для создания питомца"""
-    payload = {
-        "id": 1,
-        "name": "Buddy",
-        "status": "available"
-    }
-    response = requests.post(f"{BASE_URL}/pet", json=payload)
-    assert response.status_code == 200
-    return response.json()
-
-
-@pytest.fixture(scope="function")  # scope - это область видимости
-def create_order():
-    """"Фикстура для создания заказа на питомца"""
-    payload = {
-        "id": 1,
-        "petId": 1,
-        "quantity": 1,
-        "status": "placed",
-        "complete": True
-    }
-    response = requests.post(f"{BASE_URL}/store/order", json=payload)
-    assert response.status_code == 200
-    return response.json()
+import pytest_asyncio
+
+from .api.async_client import AsyncApiClient
+from .api.cassette import Cassette
+from .api.client import ApiClient
+from .api.ids import IdAllocator
+from .api.resources import async_created_order, async_created_pet, order_payload, pet_payload
+from .api.timings import TimingRecorder
+from .plugin import BASE_URL
+from .stub.fault_proxy import FaultProxy, FaultRule, load_rules
+from .stub.petstore_server import PetstoreServer
+
+
+base_url_key = pytest.StashKey[str]()
+local_server_key = pytest.StashKey[PetstoreServer]()
+fault_proxy_key = pytest.StashKey[FaultProxy]()
+fault_stats_key = pytest.StashKey[dict]()
+connection_stats_key = pytest.StashKey[dict]()
+
+
+def pytest_configure(config):
+    if config.getoption("--local-server"):
+        server = PetstoreServer().start()
+        config.stash[local_server_key] = server
+        config.stash[base_url_key] = server.base_url
+    else:
+        config.stash[base_url_key] = config.getoption("--base-url") or BASE_URL
+    if config.getoption("--fault-profile"):
+        proxy = FaultProxy(config.stash[base_url_key], load_rules(config.getoption("--fault-profile")),
+                           seed=config.getoption("--fault-seed")).start()
+        config.stash[fault_proxy_key] = proxy
+        config.stash[base_url_key] = proxy.base_url
+
+
+def pytest_unconfigure(config):
+    proxy = config.stash.get(fault_proxy_key, None)
+    if proxy is not None:
+        proxy.stop()
+    server = config.stash.get(local_server_key, None)
+    if server is not None:
+        server.stop()
+
+
+def worker_file(path):
+    """Путь к файлу воркера xdist: timings.jsonl -> timings.gw0.jsonl, чтобы воркеры не писали в один файл"""
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if not path or not worker:
+        return path
+    return worker_file_pattern(path, worker)
+
+
+def worker_file_pattern(path, worker="gw*"):
+    directory, name = os.path.split(path)
+    stem, dot, extension = name.partition(".")
+    return os.path.join(directory, f"{stem}.{worker}{dot}{extension}")
+
+
+@pytest.fixture(scope="session")
+def base_url(pytestconfig):
+    """Фикстура базового URL API, на который направлены тесты"""
+    return pytestconfig.stash[base_url_key]
+
+
+@pytest.fixture(scope="session")
+def timing_recorder(pytestconfig):
+    """Фикстура записи таймингов HTTP-запросов в Allure и в файл --timings-file"""
+    recorder = TimingRecorder(worker_file(pytestconfig.getoption("--timings-file")))
+    yield recorder
+    recorder.close()
+
+
+@pytest.fixture(autouse=True)
+def current_test_timings(request, timing_recorder):
+    """Фикстура, помечающая тайминги запросов ID текущего теста"""
+    timing_recorder.current_test = request.node.nodeid
+    yield
+    timing_recorder.current_test = None
+
+
+@pytest.fixture(scope="session")
+def cassette(pytestconfig):
+    """Фикстура кассеты HTTP-ответов; None, если --cassette не задан"""
+    path = pytestconfig.getoption("--cassette")
+    if not path:
+        yield None
+        return
+    mode = pytestconfig.getoption("--cassette-mode")
+    replay_paths = None
+    if mode == "record":
+        path = worker_file(path)
+    elif not os.path.exists(path):
+        # Кассета записана с xdist: воспроизводим объединение кассет всех воркеров
+        replay_paths = sorted(glob.glob(worker_file_pattern(path))) or None
+    cassette = Cassette(path, mode, replay_paths=replay_paths)
+    yield cassette
+    cassette.save()
+
+
+@pytest.fixture(scope="session")
+def api_client(pytestconfig, base_url, timing_recorder, cassette):
+    """Фикстура HTTP-клиента, общего для всей сессии"""
+    client = ApiClient(
+        base_url,
+        pool_size=pytestconfig.getoption("--api-pool-size"),
+        retries=pytestconfig.getoption("--api-retries"),
+        timeout=pytestconfig.getoption("--api-timeout"),
+        cassette=cassette
+    )
+    client.listeners.append(timing_recorder.record)
+    yield client
+    pytestconfig.stash[connection_stats_key] = client.connection_stats()
+    client.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_api_client(pytestconfig, base_url, timing_recorder, cassette):
+    """Фикстура асинхронного HTTP-клиента, общего для всей сессии"""
+    client = AsyncApiClient(
+        base_url,
+        pool_size=pytestconfig.getoption("--api-pool-size"),
+        retries=pytestconfig.getoption("--api-retries"),
+        timeout=pytestconfig.getoption("--api-timeout"),
+        cassette=cassette
+    )
+    client.listeners.append(timing_recorder.record)
+    yield client
+    await client.close()
+
+
+def pytest_sessionfinish(session):
+    stats = session.config.stash.get(connection_stats_key, None)
+    # Воркер xdist передаёт статистику пула контроллеру: отчёт печатает только он
+    if stats and hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["connection_stats"] = stats
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Суммирует статистику пулов воркеров xdist на контроллере"""
+    stats = getattr(node, "workeroutput", {}).get("connection_stats")
+    if not stats:
+        return
+    totals = node.config.stash.setdefault(connection_stats_key,
+                                          {"requests": 0, "connections": 0, "reused": 0, "workers": 0})
+    for key, value in stats.items():
+        totals[key] += value
+    totals["workers"] += 1
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    stats = config.stash.get(connection_stats_key, None)
+    if stats:
+        terminalreporter.write_sep("-", "HTTP connection pool")
+        workers = f" (sum over {stats['workers']} xdist workers)" if "workers" in stats else ""
+        terminalreporter.write_line(
+            f"requests: {stats['requests']}, connections opened: {stats['connections']}, "
+            f"reused: {stats['reused']}{workers}"
+        )
+    proxy = config.stash.get(fault_proxy_key, None)
+    fault_stats = proxy.stats if proxy is not None else config.stash.get(fault_stats_key, None)
+    if fault_stats:
+        terminalreporter.write_sep("-", "fault proxy")
+        for endpoint, row in sorted(fault_stats.items()):
+            terminalreporter.write_line(
+                f"{endpoint:<32}{row['requests']:>6} requests{row['delay_s']:>9.2f} s delay"
+                f"{row['errors']:>5} errors{row['resets']:>5} resets"
+            )
+
+
+@pytest.fixture(scope="session")
+def fault_proxy(pytestconfig, base_url, cassette):
+    """Фикстура прокси перед API, внедряющего задержки и ошибки по правилам FaultRule"""
+    if cassette is not None and not cassette.recording:
+        pytest.skip("Прокси с неисправностями требует сети, а кассета воспроизводится без неё")
+    proxy = pytestconfig.stash.get(fault_proxy_key, None)
+    if proxy is not None:
+        yield proxy
+        return
+    proxy = FaultProxy(base_url, seed=pytestconfig.getoption("--fault-seed")).start()
+    yield proxy
+    proxy.stop()
+    pytestconfig.stash[fault_stats_key] = proxy.stats
+
+
+@pytest.fixture(scope="function")
+def faults(fault_proxy):
+    """Фикстура добавления правил прокси на время теста: faults(endpoint="GET /pet/*", fault="error", times=2)"""
+    rules = []
+
+    def inject(**kwargs):
+        rules.append(fault_proxy.add(FaultRule(**kwargs)))
+        return rules[-1]
+
+    yield inject
+    for rule in rules:
+        fault_proxy.remove(rule)
+
+
+@pytest.fixture(scope="session")
+def id_allocator(pytestconfig):
+    """Фикстура аллокатора ID, закреплённого за текущим воркером"""
+    return IdAllocator.for_worker(base=pytestconfig.getoption("--id-base"))
+
+
+@pytest.fixture(scope="function")
+def ids(request, pytestconfig, id_allocator):
+    """Фикстура собственного диапазона ID для теста"""
+    if pytestconfig.getoption("--cassette"):
+        # Для воспроизведения кассеты ID теста не должны зависеть от порядка и набора запущенных тестов
+        return IdAllocator.for_test(request.node.nodeid, base=pytestconfig.getoption("--id-base"))
+    return id_allocator.allocate()
+
+
+@pytest.fixture(scope="function")
+def cleanup():
+    """Фикстура для отложенного удаления сущностей, созданных в тесте: cleanup.callback(...)"""
+    with ExitStack() as stack:
+        yield stack
+
+
+@pytest.fixture(scope="function")
+def new_pet_id(api_client, ids):
+    """Фикстура ID для питомца, создаваемого в тесте; питомец удаляется после теста"""
+    pet_id = ids.next_id()
+    yield pet_id
+    api_client.delete(f"/pet/{pet_id}")
+
+
+@pytest.fixture(scope="function")
+def new_order_id(api_client, ids):
+    """Фикстура ID для заказа, создаваемого в тесте; заказ удаляется после теста"""
+    order_id = ids.next_id()
+    yield order_id
+    api_client.delete(f"/store/order/{order_id}")
+
+
+@pytest_asyncio.fixture(scope="function")
+async def async_create_pet(async_api_client, ids):
+    """Асинхронная фикстура для создания питомца"""
+    async with async_created_pet(async_api_client, pet_payload(ids.next_id())) as pet:
+        yield pet
+
+
+@pytest_asyncio.fixture(scope="function")
+async def async_create_order(async_api_client, ids):
+    """Асинхронная фикстура для создания заказа на питомца"""
+    async with async_created_order(async_api_client, order_payload(ids.next_id(), pet_id=ids.next_id())) as order:
+        yield order
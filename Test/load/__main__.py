@@ -0,0 +1,55 @@
+"""Нагрузочный прогон сценариев TestPet/TestStore: python -m Test.load --users 20 --rps 100"""
+import argparse
+import json
+
+from ..plugin import BASE_URL
+from ..stub.petstore_server import PetstoreServer
+from .runner import LOAD_ID_BASE, LoadClient, LoadRunner, RateLimiter, format_report
+from .scenarios import collect_scenarios
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m Test.load", description=__doc__)
+    parser.add_argument("--base-url", default=BASE_URL, help="Базовый URL Petstore API")
+    parser.add_argument("--local-server", action="store_true", help="Нагружать локальный Petstore API")
+    parser.add_argument("--users", type=int, default=10, help="Количество виртуальных пользователей")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="Время в секундах, за которое стартуют все пользователи")
+    parser.add_argument("--duration", type=float, default=60.0, help="Длительность прогона в секундах")
+    parser.add_argument("--rps", type=float, default=0.0, help="Целевое количество запросов в секунду (0 - без ограничения)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Таймаут HTTP-запроса в секундах")
+    parser.add_argument("--id-base", type=int, default=LOAD_ID_BASE,
+                        help="Начало диапазона ID; по умолчанию не пересекается с диапазонами тестов pytest")
+    parser.add_argument("--seed", type=int, default=None, help="Seed выбора сценариев")
+    parser.add_argument("--report-json", help="Файл для отчёта в формате JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    server = PetstoreServer().start() if args.local_server else None
+    base_url = server.base_url if server else args.base_url
+    client = LoadClient(
+        base_url,
+        rate_limiter=RateLimiter(args.rps) if args.rps > 0 else None,
+        pool_size=args.users,
+        retries=0,
+        timeout=args.timeout
+    )
+    runner = LoadRunner(client, collect_scenarios(), users=args.users, ramp_up=args.ramp_up,
+                        duration=args.duration, seed=args.seed, id_base=args.id_base)
+    try:
+        report = runner.run()
+    finally:
+        client.close()
+        if server:
+            server.stop()
+    print(format_report(report))
+    if args.report_json:
+        with open(args.report_json, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    failed = sum(row["failed"] + row["errors"] for row in report["scenarios"].values())
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,186 @@
+import math
+import random
+import threading
+import time
+from collections import Counter, defaultdict
+
+from ..api.client import ApiClient, endpoint_name
+from ..api.ids import BASE_ID, TEST_SLOTS_OFFSET, WORKER_BLOCK_SIZE, IdAllocator
+
+# Начало диапазона ID нагрузочного прогона: последний диапазон воркера перед диапазонами тестов,
+# чтобы прогон на том же хосте не трогал сущности тестов pytest (с xdist и без)
+LOAD_ID_BASE = BASE_ID + TEST_SLOTS_OFFSET - WORKER_BLOCK_SIZE
+# ID на одну итерацию сценария: сценарии создают не больше двух-трёх сущностей
+SCENARIO_ID_BLOCK = 8
+# Сколько разных исключений показывать в отчёте
+REPORTED_PROBLEMS = 10
+
+
+def percentile(values, percent):
+    """Перцентиль по методу ближайшего ранга; values должны быть отсортированы"""
+    if not values:
+        return 0.0
+    rank = max(math.ceil(percent / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+class RateLimiter:
+    """Равномерно распределяет запросы так, чтобы суммарно было не больше rps в секунду"""
+
+    def __init__(self, rps):
+        self.interval = 1 / rps
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class LoadClient(ApiClient):
+    """ApiClient, который перед каждым запросом ждёт слот у RateLimiter"""
+
+    def __init__(self, base_url, rate_limiter=None, **kwargs):
+        super().__init__(base_url, **kwargs)
+        self.rate_limiter = rate_limiter
+
+    def request(self, method, path, **kwargs):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        return super().request(method, path, **kwargs)
+
+
+class LoadStats:
+    """Латентность запросов по эндпоинтам и результаты сценариев"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.scenarios = defaultdict(lambda: {"passed": 0, "failed": 0, "errors": 0})
+        # (сценарий, "Тип: сообщение") -> количество упавших и прерванных исключением итераций
+        self.problems = Counter()
+        self.started = self.finished = None
+
+    def record_request(self, method, path, response, elapsed):
+        name = endpoint_name(method, path)
+        with self._lock:
+            self.latencies[name].append(elapsed)
+            if response is None or response.status_code >= 500:
+                self.errors[name] += 1
+
+    def record_scenario(self, name, outcome, error=None):
+        with self._lock:
+            self.scenarios[name][outcome] += 1
+            if error is not None:
+                self.problems[(name, f"{type(error).__name__}: {error}")] += 1
+
+    def report(self):
+        duration = (self.finished or time.monotonic()) - self.started
+        endpoints = {}
+        for name, values in sorted(self.latencies.items()):
+            values = sorted(values)
+            endpoints[name] = {
+                "requests": len(values),
+                "errors": self.errors[name],
+                "rps": len(values) / duration,
+                "p50_ms": percentile(values, 50) * 1000,
+                "p95_ms": percentile(values, 95) * 1000,
+                "p99_ms": percentile(values, 99) * 1000
+            }
+        total = sum(len(values) for values in self.latencies.values())
+        return {
+            "duration_s": duration,
+            "requests": total,
+            "rps": total / duration,
+            "endpoints": endpoints,
+            "scenarios": dict(self.scenarios),
+            "problems": [
+                {"scenario": name, "error": error, "count": count}
+                for (name, error), count in self.problems.most_common(REPORTED_PROBLEMS)
+            ]
+        }
+
+
+class LoadRunner:
+    """Виртуальные пользователи, которые выполняют взвешенные сценарии до истечения duration"""
+
+    def __init__(self, client, scenarios, users=10, ramp_up=0.0, duration=60.0, seed=None, id_base=LOAD_ID_BASE):
+        self.client = client
+        self.scenarios = scenarios
+        self.weights = [scenario.weight for scenario in scenarios]
+        self.users = users
+        self.ramp_up = ramp_up
+        self.duration = duration
+        self.seed = seed
+        self.stats = LoadStats()
+        self.id_base = id_base
+        self.id_allocator = IdAllocator.for_worker(0, base=id_base)
+        self._ids_lock = threading.Lock()
+        client.listeners.append(self.stats.record_request)
+
+    def scenario_ids(self):
+        """Небольшой диапазон ID на итерацию; исчерпанный диапазон воркера начинается заново
+
+        Сценарии удаляют созданные сущности, поэтому повторная выдача ID через миллион итераций безопасна.
+        """
+        with self._ids_lock:
+            try:
+                return self.id_allocator.allocate(SCENARIO_ID_BLOCK)
+            except RuntimeError:
+                self.id_allocator = IdAllocator.for_worker(0, base=self.id_base)
+                return self.id_allocator.allocate(SCENARIO_ID_BLOCK)
+
+    def run(self):
+        self.stats.started = time.monotonic()
+        deadline = self.stats.started + self.duration
+        threads = []
+        for user in range(self.users):
+            start_at = self.stats.started + self.ramp_up * user / self.users
+            thread = threading.Thread(target=self.virtual_user, args=(user, start_at, deadline), daemon=True)
+            thread.start()
+            threads.append(thread)
+        for thread in threads:
+            thread.join()
+        self.stats.finished = time.monotonic()
+        return self.stats.report()
+
+    def virtual_user(self, user, start_at, deadline):
+        rng = random.Random(None if self.seed is None else self.seed + user)
+        time.sleep(max(start_at - time.monotonic(), 0))
+        while time.monotonic() < deadline:
+            scenario = rng.choices(self.scenarios, weights=self.weights)[0]
+            try:
+                scenario.run(self.client, self.scenario_ids())
+            except AssertionError as error:
+                self.stats.record_scenario(scenario.name, "failed", error)
+            except Exception as error:
+                self.stats.record_scenario(scenario.name, "errors", error)
+            else:
+                self.stats.record_scenario(scenario.name, "passed")
+
+
+def format_report(report):
+    lines = [
+        f"{'endpoint':<28}{'requests':>10}{'errors':>8}{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+    ]
+    for name, row in report["endpoints"].items():
+        lines.append(
+            f"{name:<28}{row['requests']:>10}{row['errors']:>8}{row['rps']:>9.1f}"
+            f"{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}{row['p99_ms']:>9.1f}"
+        )
+    lines.append(f"total: {report['requests']} requests in {report['duration_s']:.1f} s, {report['rps']:.1f} rps")
+    lines.append("")
+    lines.append(f"{'scenario':<60}{'passed':>8}{'failed':>8}{'errors':>8}")
+    for name, row in sorted(report["scenarios"].items()):
+        lines.append(f"{name:<60}{row['passed']:>8}{row['failed']:>8}{row['errors']:>8}")
+    if report["problems"]:
+        lines.append("")
+        lines.append(f"{'count':>8}  scenario: error")
+        for problem in report["problems"]:
+            lines.append(f"{problem['count']:>8}  {problem['scenario']}: {problem['error'][:200]}")
+    return "\n".join(lines)
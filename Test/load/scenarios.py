@@ -0,0 +1,104 @@
+import inspect
+from contextlib import ExitStack
+
+from ..api.resources import created_order, created_pet, order_payload, pet_payload
+from ..scenarios.engine import ScenarioRunner, load_scenarios, required_fixtures
+from ..test_pet import TestPet
+from ..test_store import TestStore
+
+# Относительная частота сценариев в нагрузке; тесты и сценарии, которых нет в словаре, получают вес 1
+WEIGHTS = {
+    "test_get_pet_by_id": 10,
+    "test_get_pets_by_status": 6,
+    "test_get_inventory_shop": 6,
+    "test_get_order_information_by_ID": 5,
+    "add_pet": 4,
+    "place_an_order_for_a_pet": 3,
+    "test_update_information_by_pet": 3,
+    "test_delete_pet_by_ID": 2,
+    "test_delete_order_by_ID": 2,
+}
+
+
+class Scenario:
+    """Тест из TestPet/TestStore, который можно выполнить вне pytest с теми же проверками"""
+
+    def __init__(self, test_class, test_name, params=None, weight=1):
+        self.test_class = test_class
+        self.test_name = test_name
+        self.params = params or {}
+        self.weight = weight
+        self.name = test_name if not params else f"{test_name}[{next(iter(self.params.values()))}]"
+
+    def run(self, client, ids):
+        test = getattr(self.test_class(), self.test_name)
+        fixture_names = [name for name in inspect.signature(test).parameters if name not in self.params]
+        with ExitStack() as stack:
+            kwargs = {name: self.fixture_value(name, client, ids, stack) for name in fixture_names}
+            test(**kwargs, **self.params)
+
+    @staticmethod
+    def fixture_value(name, client, ids, stack):
+        """Значение фикстуры из conftest.py, созданное теми же хелперами"""
+        if name == "api_client":
+            return client
+        if name == "ids":
+            return ids
+        # Под нагрузкой каждый сценарий работает со своей копией общих ресурсов
+        if name == "shared_pet":
+            return stack.enter_context(created_pet(client, pet_payload(ids.next_id())))
+        if name == "shared_order":
+            return stack.enter_context(created_order(client, order_payload(ids.next_id(), pet_id=ids.next_id())))
+        if name == "new_pet_id":
+            pet_id = ids.next_id()
+            stack.callback(client.delete, f"/pet/{pet_id}")
+            return pet_id
+        if name == "new_order_id":
+            order_id = ids.next_id()
+            stack.callback(client.delete, f"/store/order/{order_id}")
+            return order_id
+        raise LookupError(f"Фикстура {name} не поддерживается в режиме нагрузки")
+
+
+class FileScenario(Scenario):
+    """Сценарий из Test/scenarios/*.yaml, выполняемый тем же ScenarioRunner, что и в pytest"""
+
+    def __init__(self, scenario, weight=1):
+        super().__init__(None, scenario["name"], weight=weight)
+        self.scenario = scenario
+
+    def run(self, client, ids):
+        with ExitStack() as stack:
+            fixtures = {name: self.fixture_value(name, client, ids, stack) for name in required_fixtures(self.scenario)}
+            ScenarioRunner(client).run(self.scenario, fixtures)
+
+
+def parametrize_cases(test):
+    """Наборы параметров из маркеров pytest.mark.parametrize теста"""
+    cases = [{}]
+    for mark in getattr(test, "pytestmark", []):
+        if mark.name != "parametrize":
+            continue
+        argnames, argvalues = mark.args[0], mark.args[1]
+        names = [name.strip() for name in argnames.split(",")] if isinstance(argnames, str) else list(argnames)
+        # pytest.param(...) хранит значения в .values
+        argvalues = [getattr(value, "values", value) for value in argvalues]
+        values = [value if len(names) > 1 else (value,) for value in argvalues]
+        cases = [{**case, **dict(zip(names, value))} for case in cases for value in values]
+    return cases
+
+
+def collect_scenarios(test_classes=(TestPet, TestStore), weights=WEIGHTS):
+    scenarios = []
+    for test_class in test_classes:
+        for test_name, test in inspect.getmembers(test_class, inspect.isfunction):
+            if not test_name.startswith("test_"):
+                continue
+            cases = parametrize_cases(test)
+            # Вес параметризованного теста делится между его наборами параметров
+            weight = weights.get(test_name, 1) / len(cases)
+            for params in cases:
+                scenarios.append(Scenario(test_class, test_name, params, weight=weight))
+    for scenario in load_scenarios():
+        scenarios.append(FileScenario(scenario, weight=weights.get(scenario["name"], 1)))
+    return scenarios
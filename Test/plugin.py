@@ -0,0 +1,40 @@
+"""Опции и плагины тестов Petstore API
+
+Подключается из корневого conftest.py, чтобы опции были зарегистрированы до разбора командной строки:
+иначе значение в форме "--base-url URL" принимается за путь к тестам, testpaths игнорируется
+и Test/conftest.py не загружается. Путь вне репозитория в значении опции ("--cassette /tmp/c.json.gz")
+pytest тоже принимает за путь к тестам, поэтому такие значения передаются через "=".
+"""
+from .api.ids import BASE_ID
+
+BASE_URL = "http://5.181.109.28:9090/api/v3"
+
+pytest_plugins = ["Test.benchmarks.plugin", "Test.caching.plugin", "Test.profiling.plugin", "Test.resilience.plugin",
+                  "Test.scheduling.plugin", "Test.seeding.plugin"]
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("petstore", "Petstore API")
+    group.addoption("--base-url",
+                    help=f"Базовый URL Petstore API (по умолчанию {BASE_URL})")
+    group.addoption("--local-server", action="store_true",
+                    help="Запустить локальный Petstore API на свободном порту и направить тесты на него")
+    group.addoption("--api-pool-size", type=int, default=10,
+                    help="Размер пула keep-alive соединений HTTP-клиента")
+    group.addoption("--api-retries", type=int, default=3,
+                    help="Количество повторов запроса при сетевых ошибках и ответах 502/503/504")
+    group.addoption("--api-timeout", type=float, default=10.0,
+                    help="Таймаут HTTP-запроса в секундах")
+    group.addoption("--id-base", type=int, default=BASE_ID,
+                    help="Начало диапазона ID, из которого воркеры получают собственные поддиапазоны")
+    group.addoption("--timings-file",
+                    help="Файл для таймингов HTTP-запросов: .csv или JSONL для остальных расширений")
+    group.addoption("--cassette",
+                    help="Файл кассеты (.json.gz) для записи или воспроизведения HTTP-ответов")
+    group.addoption("--cassette-mode", choices=("record", "replay"), default="replay",
+                    help="record - записать ответы API в кассету, replay - отвечать из кассеты без сети")
+    group.addoption("--fault-profile",
+                    help="JSON-файл с правилами FaultRule: все запросы сессии идут через прокси, "
+                         "внедряющий задержки и ошибки")
+    group.addoption("--fault-seed", type=int, default=0,
+                    help="Seed генератора задержек и срабатываний неисправностей прокси")
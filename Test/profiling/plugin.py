@@ -0,0 +1,212 @@
+import csv
+import os
+import threading
+import time
+from collections import defaultdict
+
+import pytest
+
+from ..api.async_client import AsyncApiClient
+from ..api.client import ApiClient
+from .sampler import StackSampler
+
+PHASES = ("setup", "call", "teardown")
+
+harness_profiler_key = pytest.StashKey["HarnessProfiler"]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("profiling", "Профилирование тестового окружения")
+    group.addoption("--harness-profile", action="store_true",
+                    help="Профилировать тесты и фикстуры: время CPU, ожидание сети и горячие точки")
+    group.addoption("--harness-profile-dir", default="harness-profile",
+                    help="Каталог для profile.folded (flamegraph) и phases.csv")
+    group.addoption("--harness-profile-interval", type=float, default=5.0,
+                    help="Интервал сэмплирования стека в миллисекундах")
+
+
+def pytest_configure(config):
+    if config.getoption("--harness-profile"):
+        config.stash[harness_profiler_key] = HarnessProfiler(
+            config.getoption("--harness-profile-dir"),
+            interval=config.getoption("--harness-profile-interval") / 1000
+        )
+
+
+class Measure:
+    """Время выполнения блока: по часам, CPU потока и в HTTP-запросах клиентов"""
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+        self.wall = time.perf_counter()
+        self.cpu = time.thread_time()
+        self.http = profiler.http_s
+
+    def result(self):
+        return {
+            "wall_s": time.perf_counter() - self.wall,
+            "cpu_s": time.thread_time() - self.cpu,
+            "http_s": self.profiler.http_s - self.http
+        }
+
+
+class HarnessProfiler:
+    """Тайминги фаз тестов и установки фикстур плюс сэмплирующий профилировщик стека"""
+
+    def __init__(self, directory, interval=0.005):
+        self.directory = directory
+        self.sampler = StackSampler(interval)
+        # Суммарное время HTTP-запросов всех клиентов, созданных за сессию
+        self.http_s = 0.0
+        self._http_lock = threading.Lock()
+        self.rows = []
+        self.fixtures = defaultdict(lambda: {"count": 0, "wall_s": 0.0, "cpu_s": 0.0, "http_s": 0.0})
+        # Пути к profile.folded и phases.csv после записи в конце сессии
+        self.paths = None
+
+    def record_http(self, method, path, response, elapsed):
+        # Клиент наполнения каталога выполняет запросы из нескольких потоков
+        with self._http_lock:
+            self.http_s += elapsed
+
+    def start(self):
+        for client_class in (ApiClient, AsyncApiClient):
+            client_class.default_listeners.append(self.record_http)
+        self.sampler.start()
+
+    def stop(self):
+        self.sampler.stop()
+        for client_class in (ApiClient, AsyncApiClient):
+            client_class.default_listeners.remove(self.record_http)
+
+    def add_fixture(self, name, measured):
+        totals = self.fixtures[name]
+        totals["count"] += 1
+        for key, value in measured.items():
+            totals[key] += value
+
+    def phase_totals(self):
+        totals = {phase: {"wall_s": 0.0, "cpu_s": 0.0, "http_s": 0.0} for phase in PHASES}
+        for row in self.rows:
+            for key in ("wall_s", "cpu_s", "http_s"):
+                totals[row["phase"]][key] += row[key]
+        return totals
+
+    def write(self):
+        os.makedirs(self.directory, exist_ok=True)
+        suffix = f".{os.environ['PYTEST_XDIST_WORKER']}" if os.environ.get("PYTEST_XDIST_WORKER") else ""
+        folded_path = os.path.join(self.directory, f"profile{suffix}.folded")
+        phases_path = os.path.join(self.directory, f"phases{suffix}.csv")
+        self.sampler.write_folded(folded_path)
+        with open(phases_path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.DictWriter(file, fieldnames=["test", "phase", "wall_s", "cpu_s", "http_s"])
+            writer.writeheader()
+            writer.writerows(self.rows)
+        return folded_path, phases_path
+
+
+def profile_phase(item, phase):
+    profiler = item.config.stash.get(harness_profiler_key, None)
+    if profiler is None:
+        return None
+    profiler.sampler.phase = phase
+    return Measure(profiler)
+
+
+def finish_phase(item, phase, measure):
+    if measure is None:
+        return
+    measure.profiler.sampler.phase = None
+    measure.profiler.rows.append({"test": item.nodeid, "phase": phase, **measure.result()})
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_setup(item):
+    measure = profile_phase(item, "setup")
+    try:
+        return (yield)
+    finally:
+        finish_phase(item, "setup", measure)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    measure = profile_phase(item, "call")
+    try:
+        return (yield)
+    finally:
+        finish_phase(item, "call", measure)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_teardown(item):
+    measure = profile_phase(item, "teardown")
+    try:
+        return (yield)
+    finally:
+        finish_phase(item, "teardown", measure)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    profiler = request.config.stash.get(harness_profiler_key, None)
+    if profiler is None:
+        return (yield)
+    measure = Measure(profiler)
+    try:
+        return (yield)
+    finally:
+        # Время включает установку фикстур, запрошенных внутри через getfixturevalue
+        profiler.add_fixture(fixturedef.argname, measure.result())
+
+
+def pytest_sessionstart(session):
+    profiler = session.config.stash.get(harness_profiler_key, None)
+    if profiler is not None:
+        profiler.start()
+
+
+def pytest_sessionfinish(session):
+    profiler = session.config.stash.get(harness_profiler_key, None)
+    if profiler is not None:
+        profiler.stop()
+        # Под xdist тесты выполняются в воркерах: контроллеру записывать нечего
+        if profiler.rows:
+            profiler.paths = profiler.write()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    profiler = config.stash.get(harness_profiler_key, None)
+    if profiler is None or not profiler.rows:
+        return
+    write = terminalreporter.write_line
+    terminalreporter.write_sep("-", "harness profile")
+    # Ожидание - время по часам без CPU потока тестов: сеть, сервер, sleep повторов.
+    # Время HTTP суммируется по запросам, поэтому у параллельных запросов (async, наполнение каталога)
+    # оно больше времени по часам
+    write(f"{'phase':<12}{'wall s':>10}{'cpu s':>10}{'wait s':>10}{'http s':>10}")
+    totals = profiler.phase_totals()
+    totals["total"] = {key: sum(row[key] for row in totals.values()) for key in ("wall_s", "cpu_s", "http_s")}
+    for phase, row in totals.items():
+        write(f"{phase:<12}{row['wall_s']:>10.3f}{row['cpu_s']:>10.3f}"
+              f"{row['wall_s'] - row['cpu_s']:>10.3f}{row['http_s']:>10.3f}")
+
+    samples = profiler.sampler.samples or 1
+    write("")
+    write(f"{'phase / category':<32}{'samples':>10}{'share':>8}")
+    for (phase, category), count in sorted(profiler.sampler.categories.items(),
+                                           key=lambda pair: (PHASES.index(pair[0][0]), -pair[1])):
+        write(f"{phase + ' / ' + category:<32}{count:>10}{count / samples:>8.1%}")
+
+    write("")
+    write(f"{'fixture setup':<32}{'count':>7}{'wall s':>10}{'cpu s':>10}{'http s':>10}")
+    fixtures = sorted(profiler.fixtures.items(), key=lambda pair: -pair[1]["wall_s"])
+    for name, row in fixtures[:10]:
+        write(f"{name:<32}{row['count']:>7}{row['wall_s']:>10.3f}{row['cpu_s']:>10.3f}{row['http_s']:>10.3f}")
+
+    write("")
+    write(f"{'hot function (self samples)':<64}{'samples':>10}{'share':>8}")
+    for function, count in profiler.sampler.functions.most_common(15):
+        write(f"{function:<64}{count:>10}{count / samples:>8.1%}")
+    write("")
+    write("flamegraph: {} (flamegraph.pl, speedscope), per-test phases: {}".format(*profiler.paths))
@@ -0,0 +1,102 @@
+import sys
+import threading
+from collections import Counter
+
+# Модули pytest, не попадающие в стеки flamegraph: они есть в каждом сэмпле и только удлиняют стек
+HIDDEN_MODULES = ("_pytest", "pluggy", "pytest", "pytest_asyncio", "runpy", "__main__")
+# Функции, в которых основной поток ждёт сеть: верхний Python-кадр при блокирующем вызове сокета
+NETWORK_FRAMES = {
+    ("socket", "readinto"), ("socket", "getaddrinfo"), ("socket", "create_connection"),
+    ("ssl", "recv_into"), ("ssl", "read"), ("ssl", "do_handshake"),
+    ("selectors", "select"), ("urllib3.util.connection", "create_connection"),
+}
+# Блокирующие ожидания вне сети: события и блокировки потоков, очереди, паузы между повторами.
+# time.sleep - функция C, поэтому паузы видны по вызывающему кадру
+WAIT_FRAMES = {
+    ("threading", "wait"), ("threading", "join"), ("threading", "_wait_for_tstate_lock"),
+    ("queue", "get"), ("queue", "put"),
+    ("concurrent.futures._base", "result"), ("concurrent.futures._base", "wait"),
+    ("concurrent.futures._base", "as_completed"),
+    ("urllib3.util.retry", "sleep_for_retry"), ("urllib3.util.retry", "_sleep_backoff"),
+}
+# Категории по модулю ближайшего к вершине стека кадра; первый совпавший префикс определяет категорию
+CATEGORIES = (
+    ("json", ("json",)),
+    ("jsonschema", ("jsonschema", "referencing", "rpds")),
+    ("yaml", ("yaml",)),
+    ("allure", ("allure", "allure_commons", "allure_pytest")),
+    ("http client", ("requests", "urllib3", "http.client", "httpx", "httpcore", "anyio", "Test.api")),
+    ("pytest", HIDDEN_MODULES),
+)
+
+
+def module_matches(module, prefixes):
+    return any(module == prefix or module.startswith(prefix + ".") for prefix in prefixes)
+
+
+def categorize(phase, frames):
+    """Категория сэмпла по стеку frames (от вершины к основанию) из кадров (модуль, функция)"""
+    if frames and frames[0] in NETWORK_FRAMES:
+        return "network"
+    if frames and frames[0] in WAIT_FRAMES:
+        return "wait"
+    for module, _ in frames:
+        if module_matches(module, ("Test",)) and not module_matches(module, ("Test.api",)):
+            break
+        for category, prefixes in CATEGORIES:
+            if module_matches(module, prefixes):
+                return category
+    return "test code" if phase == "call" else "fixtures"
+
+
+class StackSampler:
+    """Фоновый поток, каждые interval секунд снимающий стек потока с тестами
+
+    Стеки копятся в формате folded (flamegraph.pl, speedscope): "фаза;модуль:функция;... число".
+    """
+
+    def __init__(self, interval=0.005, thread_id=None):
+        self.interval = interval
+        self.thread_id = thread_id or threading.main_thread().ident
+        # Текущая фаза теста (setup, call, teardown); вне фаз сэмплы не снимаются
+        self.phase = None
+        self.stacks = Counter()
+        self.categories = Counter()
+        self.functions = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="harness-profiler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            phase = self.phase
+            frame = sys._current_frames().get(self.thread_id)
+            if phase is None or frame is None:
+                continue
+            frames = []
+            while frame is not None:
+                frames.append((frame.f_globals.get("__name__", "?"), frame.f_code.co_name))
+                frame = frame.f_back
+            self.record(phase, frames)
+
+    def record(self, phase, frames):
+        self.samples += 1
+        self.categories[(phase, categorize(phase, frames))] += 1
+        visible = [f"{module}:{function}" for module, function in reversed(frames)
+                   if not module_matches(module, HIDDEN_MODULES)]
+        if visible:
+            self.functions[visible[-1]] += 1
+        self.stacks[";".join([phase] + visible)] += 1
+
+    def write_folded(self, path):
+        with open(path, "w", encoding="utf-8") as file:
+            for stack, count in sorted(self.stacks.items()):
+                file.write(f"{stack} {count}\n")
@@ -0,0 +1,94 @@
+from fnmatch import fnmatchcase
+
+import pytest
+
+from ..api.client import endpoint_name
+
+request_log_key = pytest.StashKey["RequestLog"]()
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "latency_slo(max_ms, endpoint='*'): каждый HTTP-запрос теста к подходящим эндпоинтам "
+        "должен выполняться не дольше max_ms миллисекунд, включая повторы"
+    )
+    config.addinivalue_line(
+        "markers",
+        "max_retries(count): за весь тест HTTP-клиент может повторить запросы не больше count раз"
+    )
+
+
+class RequestLog:
+    """HTTP-запросы теста: эндпоинт, полное время и количество повторов клиента"""
+
+    def __init__(self):
+        self.entries = []
+
+    def record(self, method, path, response, elapsed):
+        retries = getattr(response.raw, "retries", None) if response is not None else None
+        self.entries.append({
+            "endpoint": endpoint_name(method, path),
+            "total_ms": elapsed * 1000,
+            "retries": len(retries.history) if retries is not None else 0,
+            "failed": response is None
+        })
+
+    def attach(self, client):
+        """Подписывает журнал на запросы клиента; возвращает клиент"""
+        client.listeners.append(self.record)
+        return client
+
+    def detach(self, client):
+        if self.record in client.listeners:
+            client.listeners.remove(self.record)
+
+    @property
+    def retries(self):
+        return sum(entry["retries"] for entry in self.entries)
+
+
+@pytest.fixture(scope="function")
+def request_log(request):
+    """Фикстура журнала HTTP-запросов теста; запросы api_client попадают в него автоматически"""
+    log = request.node.stash.setdefault(request_log_key, RequestLog())
+    if "api_client" in request.fixturenames:
+        client = request.getfixturevalue("api_client")
+        log.attach(client)
+        yield log
+        log.detach(client)
+    else:
+        yield log
+
+
+@pytest.fixture(autouse=True)
+def http_expectations(request):
+    """Фикстура, включающая журнал запросов для тестов с маркерами latency_slo и max_retries"""
+    if request.node.get_closest_marker("latency_slo") or request.node.get_closest_marker("max_retries"):
+        request.getfixturevalue("request_log")
+
+
+def check_expectations(item, log):
+    errors = []
+    for marker in item.iter_markers("latency_slo"):
+        max_ms = marker.args[0] if marker.args else marker.kwargs["max_ms"]
+        pattern = marker.kwargs.get("endpoint", "*")
+        for entry in log.entries:
+            if fnmatchcase(entry["endpoint"], pattern) and entry["total_ms"] > max_ms:
+                errors.append(f"{entry['endpoint']}: {entry['total_ms']:.0f} мс превышает SLO {max_ms} мс")
+    marker = item.get_closest_marker("max_retries")
+    if marker is not None:
+        count = marker.args[0] if marker.args else marker.kwargs["count"]
+        if log.retries > count:
+            errors.append(f"Клиент повторил запросы {log.retries} раз, допустимо не больше {count}")
+    if errors:
+        raise AssertionError("\n".join(errors))
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    result = yield
+    log = item.stash.get(request_log_key, None)
+    if log is not None:
+        check_expectations(item, log)
+    return result
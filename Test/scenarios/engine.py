@@ -0,0 +1,147 @@
+import os
+import re
+
+import allure
+import pytest
+import yaml
+from jsonschema.exceptions import best_match
+
+from ..schemas.registry import registry
+
+SCENARIOS_DIR = os.path.dirname(os.path.abspath(__file__))
+# Подстановка ${name} или ${name.field}; строка целиком из подстановки сохраняет тип значения
+VARIABLE = re.compile(r"\$\{([\w.]+)\}")
+REQUEST_KEYS = ("json", "params", "headers")
+
+
+def load_scenarios(directory=SCENARIOS_DIR):
+    """Сценарии из всех *.yaml каталога; каждый файл - список сценариев"""
+    scenarios = []
+    names = set()
+    for file_name in sorted(os.listdir(directory)):
+        if not file_name.endswith(".yaml"):
+            continue
+        with open(os.path.join(directory, file_name), encoding="utf-8") as file:
+            for scenario in yaml.safe_load(file) or []:
+                if "name" not in scenario or "steps" not in scenario:
+                    raise ValueError(f"{file_name}: у сценария должны быть name и steps: {scenario}")
+                if scenario["name"] in names:
+                    raise ValueError(f"{file_name}: сценарий {scenario['name']} уже объявлен")
+                names.add(scenario["name"])
+                scenarios.append(scenario)
+    return scenarios
+
+
+def scenario_marks(scenario):
+    """Маркеры pytest из поля marks: ["idempotent", {"latency_slo": 2000}]"""
+    marks = []
+    for mark in scenario.get("marks", []):
+        if isinstance(mark, str):
+            marks.append(getattr(pytest.mark, mark))
+            continue
+        for name, args in mark.items():
+            marks.append(getattr(pytest.mark, name)(*(args if isinstance(args, list) else [args])))
+    return marks
+
+
+def required_fixtures(scenario):
+    """Фикстуры, значения которых нужны сценарию"""
+    fixtures = list(scenario.get("fixtures", []))
+    if scenario.get("ids") and "ids" not in fixtures:
+        fixtures.append("ids")
+    return fixtures
+
+
+def lookup(variables, name):
+    value = variables
+    for part in name.split("."):
+        value = value[part]
+    return value
+
+
+def render(value, variables):
+    """Значение с подставленными ${...}"""
+    if isinstance(value, str):
+        match = VARIABLE.fullmatch(value)
+        if match:
+            return lookup(variables, match.group(1))
+        return VARIABLE.sub(lambda found: str(lookup(variables, found.group(1))), value)
+    if isinstance(value, dict):
+        return {key: render(item, variables) for key, item in value.items()}
+    if isinstance(value, list):
+        return [render(item, variables) for item in value]
+    return value
+
+
+def parse_body(response):
+    """Тело ответа, разобранное один раз: JSON для application/json, иначе текст"""
+    if "json" in response.headers.get("Content-Type", ""):
+        try:
+            return response.json()
+        except ValueError:
+            pass
+    return response.text
+
+
+def check_response(response, expect):
+    """Проверяет статус, текст, поля и json-схему ответа за один разбор тела; все расхождения - в одной ошибке"""
+    errors = []
+    if "status" in expect and response.status_code != expect["status"]:
+        errors.append(f"Код ответа {response.status_code}, ожидался {expect['status']}")
+    body = parse_body(response)
+    if "text" in expect:
+        # Текст ошибки приходит либо строкой, либо в поле message JSON-ответа
+        text = body.get("message", "") if isinstance(body, dict) else body
+        if text != expect["text"]:
+            errors.append(f"Текст ответа {text!r}, ожидался {expect['text']!r}")
+    if "json" in expect or "schema" in expect:
+        if not isinstance(body, (dict, list)):
+            errors.append("Ответ не является JSON")
+        else:
+            for field, expected in expect.get("json", {}).items():
+                actual = body.get(field) if isinstance(body, dict) else None
+                if actual != expected:
+                    errors.append(f"{field}: получено {actual!r}, ожидалось {expected!r}")
+            if "schema" in expect:
+                validator = registry.validator(expect["schema"])
+                if not validator.is_valid(body):
+                    errors.append(f"Ответ не соответствует схеме {expect['schema']}: "
+                                  f"{best_match(validator.iter_errors(body)).message}")
+    assert not errors, "\n".join(errors)
+    return body
+
+
+def check_title(expect):
+    parts = []
+    if "status" in expect:
+        parts.append(f"статус {expect['status']}")
+    if "text" in expect:
+        parts.append("текст")
+    if "json" in expect:
+        parts.append("поля " + ", ".join(expect["json"]))
+    if "schema" in expect:
+        parts.append(f"json-схема {expect['schema']}")
+    return "Проверка ответа: " + "; ".join(parts)
+
+
+class ScenarioRunner:
+    """Выполняет шаги сценария через HTTP-клиент, оформляя каждый запрос и проверку шагом Allure"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def run(self, scenario, fixtures):
+        variables = dict(fixtures)
+        for name in scenario.get("ids", []):
+            variables[name] = fixtures["ids"].next_id()
+        for step in scenario["steps"]:
+            self.run_step(render(step, variables))
+
+    def run_step(self, step):
+        request = step["request"]
+        with allure.step(step.get("title", f"{request['method']} {request['path']}")):
+            kwargs = {key: request[key] for key in REQUEST_KEYS if key in request}
+            response = self.client.request(request["method"], request["path"], **kwargs)
+        expect = step.get("expect", {})
+        with allure.step(check_title(expect)):
+            return check_response(response, expect)
@@ -0,0 +1,125 @@
+from contextlib import ExitStack
+
+import pytest
+
+from ..api.resources import created_order, created_pet, order_payload, pet_payload
+
+# Порядок выполнения тестов одного модуля, работающих с общим ресурсом
+ACCESS_ORDER = {"read": 0, "write": 1, "destroy": 2}
+
+# Имя ресурса -> контекстный менеджер, создающий его и удаляющий при выходе
+RESOURCE_FACTORIES = {
+    "pet": lambda client, ids: created_pet(client, pet_payload(ids.next_id())),
+    "order": lambda client, ids: created_order(client, order_payload(ids.next_id(), pet_id=ids.next_id())),
+}
+
+resource_stats_key = pytest.StashKey[dict]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("petstore")
+    group.addoption("--isolate-resources", action="store_true",
+                    help="Создавать shared_pet/shared_order заново для каждого теста вместо одного на модуль")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "uses_resource(name, access): тест работает с общим ресурсом name (pet, order) с доступом "
+        "read, write или destroy; тесты модуля выполняются в порядке read -> write -> destroy"
+    )
+    config.stash[resource_stats_key] = {"created": 0, "reused": 0}
+
+
+def resource_access(item):
+    marker = item.get_closest_marker("uses_resource")
+    if marker is None:
+        return None
+    name = marker.args[0]
+    access = marker.args[1] if len(marker.args) > 1 else marker.kwargs.get("access", "read")
+    if access not in ACCESS_ORDER:
+        raise pytest.UsageError(f"{item.nodeid}: неизвестный доступ к ресурсу {name}: {access}")
+    return name, access
+
+
+def pytest_collection_modifyitems(config, items):
+    """Переставляет тесты с общими ресурсами внутри модуля: сначала читающие, затем изменяющие и удаляющие"""
+    slots_by_module = {}
+    for index, item in enumerate(items):
+        access = resource_access(item)
+        if access is not None:
+            slots_by_module.setdefault(item.module, []).append((index, access))
+    for slots in slots_by_module.values():
+        ordered = sorted(slots, key=lambda slot: (slot[1][0], ACCESS_ORDER[slot[1][1]], slot[0]))
+        moved = [items[index] for index, _ in ordered]
+        for (index, _), item in zip(slots, moved):
+            items[index] = item
+
+
+class ResourcePool:
+    """Общие ресурсы модуля: создаются при первом обращении и удаляются в конце модуля или после destroy"""
+
+    def __init__(self, client, stats, isolated=False):
+        self.client = client
+        self.stats = stats
+        self.isolated = isolated
+        self._resources = {}
+
+    def acquire(self, name, ids):
+        if name in self._resources:
+            self.stats["reused"] += 1
+            return self._resources[name][0]
+        stack = ExitStack()
+        value = stack.enter_context(RESOURCE_FACTORIES[name](self.client, ids))
+        self._resources[name] = (value, stack)
+        self.stats["created"] += 1
+        return value
+
+    def release(self, name, access):
+        """Освобождает ресурс после теста, если дальше им пользоваться нельзя"""
+        if name in self._resources and (self.isolated or access == "destroy"):
+            _, stack = self._resources.pop(name)
+            stack.close()
+
+    def close(self):
+        for _, stack in self._resources.values():
+            stack.close()
+        self._resources.clear()
+
+
+@pytest.fixture(scope="module")
+def resource_pool(pytestconfig, api_client):
+    """Фикстура пула общих ресурсов модуля"""
+    # Кассета записывает ответы по тестам, поэтому при её использовании ресурсы не разделяются
+    isolated = pytestconfig.getoption("--isolate-resources") or bool(pytestconfig.getoption("--cassette"))
+    pool = ResourcePool(api_client, pytestconfig.stash[resource_stats_key], isolated=isolated)
+    yield pool
+    pool.close()
+
+
+def shared_resource(request, pool, ids, name):
+    access = resource_access(request.node)
+    if access is None or access[0] != name:
+        raise pytest.UsageError(f"{request.node.nodeid}: shared_{name} требует маркер uses_resource('{name}', ...)")
+    value = pool.acquire(name, ids)
+    yield value
+    pool.release(name, access[1])
+
+
+@pytest.fixture(scope="function")
+def shared_pet(request, resource_pool, ids):
+    """Фикстура питомца, общего для тестов модуля с маркером uses_resource("pet", ...)"""
+    yield from shared_resource(request, resource_pool, ids, "pet")
+
+
+@pytest.fixture(scope="function")
+def shared_order(request, resource_pool, ids):
+    """Фикстура заказа, общего для тестов модуля с маркером uses_resource("order", ...)"""
+    yield from shared_resource(request, resource_pool, ids, "order")
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    stats = config.stash.get(resource_stats_key, None)
+    if stats and stats["created"] + stats["reused"]:
+        terminalreporter.write_sep("-", "shared resources")
+        terminalreporter.write_line(f"created: {stats['created']}, reused: {stats['reused']}")
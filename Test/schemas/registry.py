@@ -0,0 +1,52 @@
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+
+from .pet_schema import INVENTORY_SCHEMA, PET_SCHEMA
+
+SCHEMAS = {
+    "pet": PET_SCHEMA,
+    "inventory": INVENTORY_SCHEMA
+}
+
+
+class SchemaRegistry:
+    """Реестр json-схем: каждая схема проверяется и компилируется в валидатор один раз"""
+
+    def __init__(self, schemas=None):
+        self._schemas = dict(SCHEMAS if schemas is None else schemas)
+        self._validators = {}
+
+    def register(self, name, schema):
+        self._schemas[name] = schema
+        self._validators.pop(name, None)
+
+    def validator(self, name):
+        validator = self._validators.get(name)
+        if validator is None:
+            schema = self._schemas[name]
+            cls = validator_for(schema)
+            cls.check_schema(schema)
+            validator = self._validators[name] = cls(schema)
+        return validator
+
+    def validate(self, name, instance):
+        """Аналог jsonschema.validate(instance, schema) на закэшированном валидаторе"""
+        validator = self.validator(name)
+        if validator.is_valid(instance):
+            return
+        raise best_match(validator.iter_errors(instance))
+
+    def validate_many(self, name, instances):
+        """Проверяет каждый элемент списка; в пути ошибки первым идёт индекс элемента"""
+        validator = self.validator(name)
+        is_valid = validator.is_valid
+        for index, instance in enumerate(instances):
+            if not is_valid(instance):
+                error = best_match(validator.iter_errors(instance))
+                error.path.appendleft(index)
+                raise error
+
+
+registry = SchemaRegistry()
+validate = registry.validate
+validate_many = registry.validate_many
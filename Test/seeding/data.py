@@ -0,0 +1,51 @@
+import random
+
+CATEGORIES = [
+    {"id": 1, "name": "Dogs"},
+    {"id": 2, "name": "Cats"},
+    {"id": 3, "name": "Birds"},
+    {"id": 4, "name": "Fish"},
+    {"id": 5, "name": "Reptiles"},
+]
+TAGS = [{"id": index, "name": name} for index, name in enumerate(
+    ["friendly", "vaccinated", "trained", "young", "senior", "small", "large", "hypoallergenic"], start=1
+)]
+NAMES = ["Buddy", "Max", "Bella", "Luna", "Charlie", "Lucy", "Rocky", "Daisy", "Milo", "Coco"]
+
+# Доли статусов в сгенерированном каталоге
+PET_STATUS_WEIGHTS = {"available": 0.6, "pending": 0.25, "sold": 0.15}
+ORDER_STATUS_WEIGHTS = {"placed": 0.5, "approved": 0.3, "delivered": 0.2}
+
+
+def generate_pets(ids, count, seed=0, status_weights=PET_STATUS_WEIGHTS):
+    """Питомцы, удовлетворяющие PET_SCHEMA, с категориями, тегами и заданным распределением статусов"""
+    rng = random.Random(seed)
+    statuses = rng.choices(list(status_weights), weights=list(status_weights.values()), k=count)
+    pets = []
+    for status in statuses:
+        pet_id = ids.next_id()
+        pets.append({
+            "id": pet_id,
+            "name": f"{rng.choice(NAMES)} {pet_id}",
+            "category": rng.choice(CATEGORIES),
+            "photoUrls": [f"https://example.com/pets/{pet_id}.jpg"],
+            "tags": rng.sample(TAGS, rng.randint(0, 3)),
+            "status": status
+        })
+    return pets
+
+
+def generate_orders(ids, count, pet_ids, seed=0, status_weights=ORDER_STATUS_WEIGHTS):
+    """Заказы на случайных питомцах из pet_ids"""
+    rng = random.Random(seed + 1)
+    statuses = rng.choices(list(status_weights), weights=list(status_weights.values()), k=count)
+    return [
+        {
+            "id": ids.next_id(),
+            "petId": rng.choice(pet_ids),
+            "quantity": rng.randint(1, 5),
+            "status": status,
+            "complete": status == "delivered"
+        }
+        for status in statuses
+    ]
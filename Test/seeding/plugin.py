@@ -0,0 +1,81 @@
+import pytest
+
+from ..api.client import ApiClient
+from ..schemas.registry import validate_many
+from .data import generate_orders, generate_pets
+from .seeder import Seeder
+
+seeding_stats_key = pytest.StashKey[list]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("seeding", "Наполнение каталога тестовыми данными")
+    group.addoption("--seed-pets", type=int, default=0,
+                    help="Количество питомцев в каталоге для тестов с фикстурой seeded_catalogue "
+                         "(0 - такие тесты пропускаются)")
+    group.addoption("--seed-orders", type=int, default=0,
+                    help="Количество заказов на питомцев каталога")
+    group.addoption("--seed-concurrency", type=int, default=16,
+                    help="Максимальное количество одновременных запросов при наполнении и очистке каталога")
+    group.addoption("--seed-batch-size", type=int, default=500,
+                    help="Размер пачки сущностей, отправляемой за один проход")
+    group.addoption("--seed-random-state", type=int, default=0,
+                    help="Seed генератора данных каталога")
+
+
+class SeededCatalogue:
+    """Созданные в API питомцы и заказы"""
+
+    def __init__(self, pets, orders):
+        self.pets = pets
+        self.orders = orders
+
+    def pets_with_status(self, status):
+        return [pet for pet in self.pets if pet["status"] == status]
+
+
+@pytest.fixture(scope="session")
+def seeded_catalogue(pytestconfig, base_url, id_allocator, cassette):
+    """Фикстура каталога из --seed-pets питомцев и --seed-orders заказов, удаляемого после сессии"""
+    pet_count = pytestconfig.getoption("--seed-pets")
+    if pet_count <= 0:
+        pytest.skip("Каталог не наполняется: укажите --seed-pets")
+    order_count = pytestconfig.getoption("--seed-orders")
+    concurrency = pytestconfig.getoption("--seed-concurrency")
+    random_state = pytestconfig.getoption("--seed-random-state")
+
+    ids = id_allocator.allocate(pet_count + order_count)
+    pets = generate_pets(ids, pet_count, seed=random_state)
+    validate_many("pet", pets)
+    orders = generate_orders(ids, order_count, [pet["id"] for pet in pets], seed=random_state)
+
+    client = ApiClient(base_url, pool_size=concurrency, timeout=pytestconfig.getoption("--api-timeout"),
+                       cassette=cassette)
+    seeder = Seeder(client, concurrency=concurrency, batch_size=pytestconfig.getoption("--seed-batch-size"))
+    pytestconfig.stash[seeding_stats_key] = seeder.stats
+    try:
+        seeder.push("/pet", pets)
+        seeder.push("/store/order", orders)
+        yield SeededCatalogue(pets, orders)
+    finally:
+        # Каждый шаг очистки выполняется, даже если предыдущий упал, чтобы каталог не остался на хосте
+        try:
+            seeder.remove("/store/order", [order["id"] for order in orders])
+        finally:
+            try:
+                seeder.remove("/pet", [pet["id"] for pet in pets])
+            finally:
+                client.close()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    stats = config.stash.get(seeding_stats_key, None)
+    if not stats:
+        return
+    terminalreporter.write_sep("-", "catalogue seeding")
+    for row in stats:
+        rate = row["count"] / row["elapsed_s"] if row["elapsed_s"] else 0
+        terminalreporter.write_line(
+            f"{row['operation']:<28}{row['count']:>8} items{row['failed']:>6} failed"
+            f"{row['elapsed_s']:>9.2f} s{rate:>9.0f}/s"
+        )
@@ -0,0 +1,51 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class SeedingError(AssertionError):
+    """Часть сущностей не удалось создать"""
+
+
+class Seeder:
+    """Создаёт и удаляет сущности пачками с ограниченным числом одновременных запросов"""
+
+    def __init__(self, client, concurrency=16, batch_size=500):
+        self.client = client
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.stats = []
+
+    @staticmethod
+    def _attempt(call, item):
+        """Код ответа или описание исключения: сбой одного запроса не должен прерывать всю пачку"""
+        try:
+            return call(item).status_code
+        except Exception as error:
+            return f"{type(error).__name__}: {error}"
+
+    def _run(self, operation, call, items):
+        start = time.perf_counter()
+        failures = []
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="seeder") as executor:
+            # Пачками, чтобы не держать в памяти future на каждую из десятков тысяч сущностей
+            for offset in range(0, len(items), self.batch_size):
+                batch = items[offset:offset + self.batch_size]
+                for item, status in zip(batch, executor.map(lambda item: self._attempt(call, item), batch)):
+                    if status != 200:
+                        failures.append((item, status))
+        elapsed = time.perf_counter() - start
+        self.stats.append({"operation": operation, "count": len(items), "failed": len(failures),
+                           "elapsed_s": elapsed})
+        return failures
+
+    def push(self, path, payloads):
+        """POST каждого payload на path; SeedingError, если хотя бы один запрос неуспешен или упал с исключением"""
+        failures = self._run(f"POST {path}", lambda payload: self.client.post(path, json=payload), payloads)
+        if failures:
+            item, status = failures[0]
+            raise SeedingError(f"POST {path}: {len(failures)} из {len(payloads)} запросов неуспешны, "
+                               f"например id={item['id']} -> {status}")
+
+    def remove(self, path, item_ids):
+        """DELETE {path}/{id} для каждого ID; неуспешные ответы и исключения только учитываются в статистике"""
+        self._run(f"DELETE {path}/{{id}}", lambda item_id: self.client.delete(f"{path}/{item_id}"), item_ids)
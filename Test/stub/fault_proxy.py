@@ -0,0 +1,213 @@
+import http.client
+import json
+import random
+import socket
+import struct
+import threading
+import time
+from fnmatch import fnmatchcase
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from ..api.client import endpoint_name
+
+# Заголовки соединения, которые прокси не передаёт дальше
+HOP_BY_HOP_HEADERS = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "te", "trailer",
+    "transfer-encoding", "upgrade", "host", "content-length"
+}
+FAULTS = ("error", "reset")
+
+
+class FaultRule:
+    """Задержка и неисправность для эндпоинтов, подходящих под шаблон, например 'GET /pet/*'
+
+    latency_ms + случайные 0..jitter_ms добавляются к каждому подходящему запросу.
+    fault: error - ответ с кодом status, reset - разрыв соединения (RST) без ответа;
+    срабатывает с вероятностью rate и не больше times раз (None - без ограничения).
+    """
+
+    def __init__(self, endpoint="*", latency_ms=0, jitter_ms=0, fault=None, status=503, rate=1.0, times=None):
+        if fault is not None and fault not in FAULTS:
+            raise ValueError(f"Неизвестная неисправность {fault!r}, ожидается одна из {FAULTS}")
+        self.endpoint = endpoint
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.fault = fault
+        self.status = status
+        self.rate = rate
+        self.times = times
+        self.matched = 0
+        self.applied = 0
+
+    def __repr__(self):
+        return (f"FaultRule({self.endpoint!r}, latency_ms={self.latency_ms}, jitter_ms={self.jitter_ms}, "
+                f"fault={self.fault!r}, status={self.status}, rate={self.rate}, times={self.times})")
+
+    def matches(self, endpoint):
+        return fnmatchcase(endpoint, self.endpoint)
+
+
+def load_rules(path):
+    """Правила из JSON-файла со списком объектов с полями FaultRule"""
+    with open(path, encoding="utf-8") as file:
+        return [FaultRule(**rule) for rule in json.load(file)]
+
+
+class FaultProxyHandler(BaseHTTPRequestHandler):
+    """Обработчик, пересылающий запросы в API и внедряющий задержки и ошибки по правилам прокси"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    upstream = None
+
+    @property
+    def proxy(self):
+        return self.server.proxy
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.forward("GET")
+
+    def do_POST(self):
+        self.forward("POST")
+
+    def do_PUT(self):
+        self.forward("PUT")
+
+    def do_DELETE(self):
+        self.forward("DELETE")
+
+    def forward(self, method):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        delay, rule = self.proxy.plan(method, self.path)
+        try:
+            if delay:
+                time.sleep(delay)
+            if rule is not None and rule.fault == "reset":
+                return self.reset_connection()
+            if rule is not None:
+                return self.send_body(rule.status, b"Injected fault", {"Content-Type": "text/plain"})
+            status, headers, response_body = self.send_upstream(method, body)
+            self.send_body(status, response_body, headers)
+        except (BrokenPipeError, ConnectionResetError):
+            # Клиент не дождался ответа (таймаут) и закрыл соединение
+            self.close_connection = True
+
+    def send_upstream(self, method, body):
+        headers = {name: value for name, value in self.headers.items() if name.lower() not in HOP_BY_HOP_HEADERS}
+        for attempt in range(2):
+            if self.upstream is None:
+                self.upstream = self.proxy.upstream_connection()
+            try:
+                self.upstream.request(method, self.path, body=body or None, headers=headers)
+                response = self.upstream.getresponse()
+                response_body = response.read()
+            except (OSError, http.client.HTTPException):
+                # Keep-alive соединение с API могло закрыться: пробуем один раз через новое
+                self.upstream.close()
+                self.upstream = None
+                if attempt:
+                    return 502, {"Content-Type": "text/plain"}, b"Bad gateway"
+                continue
+            response_headers = {name: value for name, value in response.getheaders()
+                                if name.lower() not in HOP_BY_HOP_HEADERS}
+            return response.status, response_headers, response_body
+
+    def send_body(self, status_code, body, headers):
+        self.send_response(status_code)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def reset_connection(self):
+        """Закрывает соединение с SO_LINGER=0, чтобы клиент получил RST вместо ответа"""
+        self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+        self.connection.close()
+        self.close_connection = True
+
+    def finish(self):
+        super().finish()
+        if self.upstream is not None:
+            self.upstream.close()
+
+
+class FaultProxy:
+    """Локальный прокси перед API на свободном порту, внедряющий задержки, ошибки 5xx и разрывы соединений"""
+
+    def __init__(self, upstream_url, rules=(), seed=0, host="127.0.0.1", port=0, upstream_timeout=30.0):
+        upstream = urlsplit(upstream_url)
+        self.upstream_scheme = upstream.scheme
+        self.upstream_address = (upstream.hostname, upstream.port)
+        self.prefix = upstream.path.rstrip("/")
+        self.upstream_timeout = upstream_timeout
+        self.rules = list(rules)
+        # Счётчики по эндпоинтам: requests, delay_s, errors, resets
+        self.stats = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), FaultProxyHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.proxy = self
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="fault-proxy", daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}{self.prefix}"
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.thread.join()
+
+    def add(self, rule):
+        with self._lock:
+            self.rules.append(rule)
+        return rule
+
+    def remove(self, rule):
+        with self._lock:
+            self.rules.remove(rule)
+
+    def upstream_connection(self):
+        connection_class = http.client.HTTPSConnection if self.upstream_scheme == "https" else http.client.HTTPConnection
+        return connection_class(*self.upstream_address, timeout=self.upstream_timeout)
+
+    def endpoint(self, method, path):
+        path = urlsplit(path).path
+        if path.startswith(self.prefix):
+            path = path[len(self.prefix):]
+        return endpoint_name(method, path)
+
+    def plan(self, method, path):
+        """Задержка в секундах и правило, неисправность которого применяется к запросу (или None)"""
+        endpoint = self.endpoint(method, path)
+        delay = 0.0
+        faulty = None
+        with self._lock:
+            for rule in self.rules:
+                if not rule.matches(endpoint):
+                    continue
+                rule.matched += 1
+                delay += (rule.latency_ms + self._random.uniform(0, rule.jitter_ms)) / 1000
+                if (faulty is None and rule.fault is not None and (rule.times is None or rule.applied < rule.times)
+                        and self._random.random() < rule.rate):
+                    rule.applied += 1
+                    faulty = rule
+            stats = self.stats.setdefault(endpoint, {"requests": 0, "delay_s": 0.0, "errors": 0, "resets": 0})
+            stats["requests"] += 1
+            stats["delay_s"] += delay
+            if faulty is not None:
+                stats["resets" if faulty.fault == "reset" else "errors"] += 1
+        return delay, faulty
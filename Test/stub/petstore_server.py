@@ -0,0 +1,249 @@
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+API_PREFIX = "/api/v3"
+PET_STATUSES = ("available", "pending", "sold")
+# Версия локального API, отдаваемая в /openapi.json; меняется вместе с поведением обработчиков
+API_VERSION = "1.0.0-local"
+
+
+class PetstoreData:
+    """In-memory хранилище питомцев и заказов с индексом питомцев по статусу"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pets = {}
+        self.pets_by_status = {status: set() for status in PET_STATUSES}
+        self.orders = {}
+        self.orders_by_status = {}
+
+    def save_pet(self, pet):
+        with self.lock:
+            old = self.pets.get(pet["id"])
+            if old is not None:
+                self.pets_by_status.get(old["status"], set()).discard(old["id"])
+            self.pets[pet["id"]] = pet
+            self.pets_by_status.setdefault(pet["status"], set()).add(pet["id"])
+        return pet
+
+    def delete_pet(self, pet_id):
+        with self.lock:
+            pet = self.pets.pop(pet_id, None)
+            if pet is not None:
+                self.pets_by_status[pet["status"]].discard(pet_id)
+
+    def find_pets(self, statuses):
+        with self.lock:
+            return [self.pets[pet_id] for status in statuses for pet_id in sorted(self.pets_by_status[status])]
+
+    def save_order(self, order):
+        with self.lock:
+            old = self.orders.get(order["id"])
+            if old is not None:
+                self.orders_by_status[old["status"]].discard(old["id"])
+            self.orders[order["id"]] = order
+            self.orders_by_status.setdefault(order["status"], set()).add(order["id"])
+        return order
+
+    def delete_order(self, order_id):
+        with self.lock:
+            order = self.orders.pop(order_id, None)
+            if order is not None:
+                self.orders_by_status[order["status"]].discard(order_id)
+
+    def inventory(self):
+        with self.lock:
+            return {
+                "approved": len(self.orders_by_status.get("approved", ())),
+                "available": len(self.pets_by_status["available"]),
+                "delivered": len(self.orders_by_status.get("delivered", ()))
+            }
+
+
+class PetstoreHandler(BaseHTTPRequestHandler):
+    """Обработчик эндпоинтов /pet и /store, повторяющий ответы Petstore API"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    routes = [
+        ("GET", re.compile(r"/openapi\.json"), "get_openapi"),
+        ("GET", re.compile(r"/pet/findByStatus"), "find_by_status"),
+        ("POST", re.compile(r"/pet"), "add_pet"),
+        ("PUT", re.compile(r"/pet"), "update_pet"),
+        ("GET", re.compile(r"/pet/(?P<item_id>[^/]+)"), "get_pet"),
+        ("DELETE", re.compile(r"/pet/(?P<item_id>[^/]+)"), "delete_pet"),
+        ("GET", re.compile(r"/store/inventory"), "get_inventory"),
+        ("POST", re.compile(r"/store/order"), "place_order"),
+        ("GET", re.compile(r"/store/order/(?P<item_id>[^/]+)"), "get_order"),
+        ("DELETE", re.compile(r"/store/order/(?P<item_id>[^/]+)"), "delete_order"),
+    ]
+
+    @property
+    def data(self):
+        return self.server.data
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.dispatch("GET")
+
+    def do_POST(self):
+        self.dispatch("POST")
+
+    def do_PUT(self):
+        self.dispatch("PUT")
+
+    def do_DELETE(self):
+        self.dispatch("DELETE")
+
+    def dispatch(self, method):
+        url = urlsplit(self.path)
+        self.query = parse_qs(url.query)
+        length = int(self.headers.get("Content-Length") or 0)
+        self.body = self.rfile.read(length) if length else b""
+        path = url.path[len(API_PREFIX):] if url.path.startswith(API_PREFIX) else None
+        for route_method, pattern, handler_name in self.routes:
+            match = pattern.fullmatch(path or "")
+            if match and route_method == method:
+                kwargs = match.groupdict()
+                if "item_id" in kwargs:
+                    try:
+                        kwargs["item_id"] = int(kwargs["item_id"])
+                    except ValueError:
+                        return self.send_text(400, "Invalid ID supplied")
+                return getattr(self, handler_name)(**kwargs)
+        self.send_text(404, "Not found")
+
+    def send_body(self, status_code, body, content_type):
+        self.send_response(status_code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_text(self, status_code, text):
+        self.send_body(status_code, text.encode(), "text/plain")
+
+    def send_json(self, status_code, payload):
+        self.send_body(status_code, json.dumps(payload).encode(), "application/json")
+
+    def read_json(self):
+        try:
+            payload = json.loads(self.body)
+        except ValueError:
+            return None
+        return payload if isinstance(payload, dict) and isinstance(payload.get("id"), int) else None
+
+    def build_pet(self, payload):
+        pet = {
+            "id": payload["id"],
+            "name": payload.get("name", ""),
+            "photoUrls": payload.get("photoUrls") or [],
+            "tags": payload.get("tags") or [],
+            "status": payload.get("status", "available")
+        }
+        if payload.get("category"):
+            pet["category"] = payload["category"]
+        return pet
+
+    def get_openapi(self):
+        self.send_json(200, {
+            "openapi": "3.0.2",
+            "info": {"title": "Swagger Petstore - OpenAPI 3.0 (local)", "version": API_VERSION},
+            "paths": {}
+        })
+
+    def find_by_status(self):
+        status = self.query.get("status", [""])[0]
+        if not status:
+            return self.send_text(400, "No status provided. Try again?")
+        statuses = status.split(",")
+        for value in statuses:
+            if value not in PET_STATUSES:
+                return self.send_text(
+                    400,
+                    f"Input error: query parameter `status value `{value}` is not in the allowable values "
+                    f"`[{', '.join(PET_STATUSES)}]`"
+                )
+        self.send_json(200, self.data.find_pets(statuses))
+
+    def add_pet(self):
+        payload = self.read_json()
+        if payload is None:
+            return self.send_text(400, "Invalid input")
+        self.send_json(200, self.data.save_pet(self.build_pet(payload)))
+
+    def update_pet(self):
+        payload = self.read_json()
+        if payload is None:
+            return self.send_text(400, "Invalid ID supplied")
+        if payload["id"] not in self.data.pets:
+            return self.send_text(404, "Pet not found")
+        self.send_json(200, self.data.save_pet(self.build_pet(payload)))
+
+    def get_pet(self, item_id):
+        pet = self.data.pets.get(item_id)
+        if pet is None:
+            return self.send_text(404, "Pet not found")
+        self.send_json(200, pet)
+
+    def delete_pet(self, item_id):
+        self.data.delete_pet(item_id)
+        self.send_text(200, "Pet deleted")
+
+    def get_inventory(self):
+        self.send_json(200, self.data.inventory())
+
+    def place_order(self):
+        payload = self.read_json()
+        if payload is None:
+            return self.send_text(400, "Invalid input")
+        order = {
+            "id": payload["id"],
+            "petId": payload.get("petId", 0),
+            "quantity": payload.get("quantity", 0),
+            "status": payload.get("status", "placed"),
+            "complete": payload.get("complete", False)
+        }
+        if "shipDate" in payload:
+            order["shipDate"] = payload["shipDate"]
+        self.send_json(200, self.data.save_order(order))
+
+    def get_order(self, item_id):
+        order = self.data.orders.get(item_id)
+        if order is None:
+            return self.send_text(404, "Order not found")
+        self.send_json(200, order)
+
+    def delete_order(self, item_id):
+        self.data.delete_order(item_id)
+        self.send_text(200, "")
+
+
+class PetstoreServer:
+    """Локальный Petstore API на свободном порту, работающий в фоновом потоке"""
+
+    def __init__(self, host="127.0.0.1", port=0):
+        self.httpd = ThreadingHTTPServer((host, port), PetstoreHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.data = PetstoreData()
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="petstore-server", daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.thread.join()
@@ -0,0 +1,87 @@
+import asyncio
+
+import allure
+import pytest
+
+from .schemas.registry import validate_many
+from .test_pet import FIND_BY_STATUS_CASES
+
+BULK_PETS_COUNT = 20
+
+
+@allure.feature("Pet")
+class TestPetAsync:
+    @allure.title("Получение информации о питомце по ID (async)")
+    @pytest.mark.asyncio
+    async def test_get_pet_by_id(self, async_api_client, async_create_pet):
+        with allure.step("Получение ID созданного питомца"):
+            pet_id = async_create_pet["id"]
+
+        with allure.step("Отправка запроса на получение информации о питомце по ID"):
+            response = await async_api_client.get(f"/pet/{pet_id}")
+
+        with allure.step("Проверка статуса ответа и данных питомца"):
+            assert response.status_code == 200, "Код ответа не совпал с ожидаемым"
+            assert response.json()["id"] == pet_id
+
+    @allure.title("Одновременное получение списков питомцев по всем статусам")
+    @pytest.mark.asyncio
+    async def test_get_pets_by_all_statuses_concurrently(self, async_api_client):
+        with allure.step("Одновременная отправка запросов на получение питомцев по каждому статусу"):
+            responses = await asyncio.gather(*(
+                async_api_client.get("/pet/findByStatus", params={"status": status})
+                for status, _, _ in FIND_BY_STATUS_CASES
+            ))
+
+        for (status, expected_status_code, expected_error_message), response in zip(FIND_BY_STATUS_CASES, responses):
+            with allure.step(f"Проверка ответа для статуса {status}"):
+                assert response.status_code == expected_status_code, "Статус отличается от ожидаемого"
+                if expected_error_message:
+                    try:
+                        error_message = response.json().get("message", "")
+                    except ValueError:
+                        error_message = response.text
+                    assert error_message == expected_error_message, "Текст ошибки не совпал с ожидаемым"
+                else:
+                    response_json = response.json()
+                    assert isinstance(response_json, list), "Ответ должен быть списком питомцев"
+                    validate_many("pet", response_json)
+
+    @allure.title("Одновременное добавление нескольких питомцев")
+    @pytest.mark.asyncio
+    async def test_bulk_add_pets(self, async_api_client, ids):
+        with allure.step("Подготовка данных для создания питомцев"):
+            payloads = [
+                {"id": ids.next_id(), "name": f"Buddy {index}", "status": "available"}
+                for index in range(BULK_PETS_COUNT)
+            ]
+
+        try:
+            with allure.step("Одновременная отправка запросов на создание питомцев"):
+                responses = await asyncio.gather(*(async_api_client.post("/pet", json=payload) for payload in payloads))
+
+            with allure.step("Проверка статусов ответов и валидация json-схемы"):
+                assert all(response.status_code == 200 for response in responses), "Код ответа не совпал с ожидаемым"
+                pets = [response.json() for response in responses]
+                validate_many("pet", pets)
+
+            with allure.step("Проверка параметров питомцев в ответах"):
+                assert [pet["id"] for pet in pets] == [payload["id"] for payload in payloads], "id ответа не совпадает с ожидаемым"
+        finally:
+            await asyncio.gather(*(async_api_client.delete(f"/pet/{payload['id']}") for payload in payloads))
+
+
+@allure.feature("Store")
+class TestStoreAsync:
+    @allure.title("Получение информации о заказе по ID (async)")
+    @pytest.mark.asyncio
+    async def test_get_order_information_by_ID(self, async_api_client, async_create_order):
+        with allure.step("Получение ID созданного заказа"):
+            order_id = async_create_order["id"]
+
+        with allure.step("Отправка запроса на получение информации о заказе по ID"):
+            response = await async_api_client.get(f"/store/order/{order_id}")
+
+        with allure.step("Проверка статуса ответа и данных заказа"):
+            assert response.status_code == 200, "Код ответа не совпал с ожидаемым"
+            assert response.json()["id"] == order_id
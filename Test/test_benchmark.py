@@ -0,0 +1,93 @@
+import json
+
+import allure
+import pytest
+
+from .api.resources import order_payload, pet_payload
+
+
+def get_pet_by_id(client, ids, cleanup):
+    pet_id = ids.next_id()
+    client.post("/pet", json=pet_payload(pet_id))
+    cleanup.callback(client.delete, f"/pet/{pet_id}")
+    return lambda _: client.get(f"/pet/{pet_id}"), None
+
+
+def find_pets_by_status(client, ids, cleanup):
+    return lambda _: client.get("/pet/findByStatus", params={"status": "available"}), None
+
+
+def add_pet(client, ids, cleanup):
+    pet_id = ids.next_id()
+    cleanup.callback(client.delete, f"/pet/{pet_id}")
+    return lambda _: client.post("/pet", json=pet_payload(pet_id)), None
+
+
+def update_pet(client, ids, cleanup):
+    pet_id = ids.next_id()
+    client.post("/pet", json=pet_payload(pet_id))
+    cleanup.callback(client.delete, f"/pet/{pet_id}")
+    return lambda _: client.put("/pet", json=pet_payload(pet_id, name="Buddy Updated", status="sold")), None
+
+
+def delete_pet(client, ids, cleanup):
+    def setup(_):
+        pet_id = ids.next_id()
+        client.post("/pet", json=pet_payload(pet_id))
+        return pet_id
+
+    return lambda pet_id: client.delete(f"/pet/{pet_id}"), setup
+
+
+def place_order(client, ids, cleanup):
+    order_id = ids.next_id()
+    pet_id = ids.next_id()
+    cleanup.callback(client.delete, f"/store/order/{order_id}")
+    return lambda _: client.post("/store/order", json=order_payload(order_id, pet_id=pet_id)), None
+
+
+def get_order_by_id(client, ids, cleanup):
+    order_id = ids.next_id()
+    client.post("/store/order", json=order_payload(order_id, pet_id=ids.next_id()))
+    cleanup.callback(client.delete, f"/store/order/{order_id}")
+    return lambda _: client.get(f"/store/order/{order_id}"), None
+
+
+def get_inventory(client, ids, cleanup):
+    return lambda _: client.get("/store/inventory"), None
+
+
+# Имя эндпоинта -> функция, которая готовит данные (удаляются через cleanup) и возвращает
+# (замеряемый вызов, setup перед каждым вызовом)
+BENCHMARKS = {
+    "GET /pet/{id}": get_pet_by_id,
+    "GET /pet/findByStatus": find_pets_by_status,
+    "POST /pet": add_pet,
+    "PUT /pet": update_pet,
+    "DELETE /pet/{id}": delete_pet,
+    "POST /store/order": place_order,
+    "GET /store/order/{id}": get_order_by_id,
+    "GET /store/inventory": get_inventory,
+}
+
+
+@allure.feature("Benchmark")
+@pytest.mark.benchmark
+class TestBenchmark:
+    @allure.title("Замер латентности эндпоинта {endpoint}")
+    @pytest.mark.parametrize("endpoint", list(BENCHMARKS))
+    def test_endpoint_latency(self, benchmark_client, benchmark_session, benchmark_ids, cleanup, endpoint):
+        with allure.step("Подготовка данных для замера"):
+            call, setup = BENCHMARKS[endpoint](benchmark_client, benchmark_ids, cleanup)
+
+        with allure.step("Проверка ответа эндпоинта"):
+            response = call(setup(None) if setup else None)
+            assert response.status_code == 200, "Код ответа не совпал с ожидаемым"
+
+        with allure.step(f"Замер {benchmark_session.iterations} вызовов после {benchmark_session.warmup} прогревочных"):
+            result = benchmark_session.measure(call, setup)
+            allure.attach(json.dumps(result, indent=2), name="Статистика", attachment_type=allure.attachment_type.JSON)
+
+        with allure.step("Сравнение с эталоном"):
+            message = benchmark_session.check(endpoint, result)
+            assert message is None, f"Регрессия латентности {endpoint}: {message}"
@@ -0,0 +1,46 @@
+import allure
+import pytest
+
+from .api.streaming import STREAM_CHUNK_SIZE, iter_json_array
+from .schemas.registry import validate, validate_many
+
+
+def collect_ids(pets, found_ids):
+    """Пропускает питомцев дальше, запоминая их ID, чтобы не держать в памяти весь список"""
+    for pet in pets:
+        found_ids.add(pet["id"])
+        yield pet
+
+
+@allure.feature("Catalogue")
+class TestCatalogue:
+    @allure.title("Получение питомцев по статусу {status} в большом каталоге")
+    @pytest.mark.parametrize("status", ["available", "pending", "sold"])
+    def test_find_seeded_pets_by_status(self, api_client, seeded_catalogue, status):
+        with allure.step("Отправка запроса на получение питомцев по статусу"):
+            response = api_client.get("/pet/findByStatus", params={"status": status}, stream=True)
+
+        with allure.step("Проверка статуса ответа и потоковая валидация json-схемы каждого питомца"):
+            assert response.status_code == 200, "Код ответа не совпал с ожидаемым"
+            found_ids = set()
+            with response:
+                pets = iter_json_array(response.iter_content(chunk_size=STREAM_CHUNK_SIZE))
+                validate_many("pet", collect_ids(pets, found_ids))
+
+        with allure.step("Проверка, что в ответе есть все питомцы каталога с этим статусом"):
+            missing = [pet["id"] for pet in seeded_catalogue.pets_with_status(status) if pet["id"] not in found_ids]
+            assert not missing, f"В ответе нет {len(missing)} питомцев каталога, например {missing[:5]}"
+
+    @allure.title("Получение инвентаря магазина для большого каталога")
+    def test_inventory_counts_seeded_pets(self, api_client, seeded_catalogue):
+        with allure.step("Отправка запроса на получение инвентаря магазина"):
+            response = api_client.get("/store/inventory")
+            response_json = response.json()
+
+        with allure.step("Проверка статуса ответа и валидация json-схемы инвентаря"):
+            assert response.status_code == 200, "Код ответа не совпал с ожидаемым"
+            validate("inventory", response_json)
+
+        with allure.step("Проверка, что инвентарь учитывает доступных питомцев каталога"):
+            available = len(seeded_catalogue.pets_with_status("available"))
+            assert response_json["available"] >= available, "Инвентарь не учитывает питомцев каталога"
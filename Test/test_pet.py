@@ -1,137 +1,44 @@
 from types import NoneType
 
 import allure
-import jsonschema
 import pytest
-import requests
-from .schemas.pet_schema import PET_SCHEMA
-
-BASE_URL = "http://5.181.109.28:9090/api/v3"
+from .api.streaming import STREAM_CHUNK_SIZE, iter_json_array
+from .schemas.registry import validate_many
+
+FIND_BY_STATUS_CASES = [
+    ("available", 200, None),  # Корректный статус
+    ("pending", 200, None),  # Корректный статус
+    ("sold", 200, None),  # Корректный статус
+    (None, 400, "No status provided. Try again?"),  # Пустой статус
+    ("new", 400, "Input error: query parameter `status value `new` is not in the allowable values `[available, pending, sold]`"),  # Некорректный статус
+]
+# Ответы с ошибкой не зависят от данных на сервере, поэтому их результат можно кэшировать
+FIND_BY_STATUS_PARAMS = [
+    pytest.param(*case, marks=pytest.mark.idempotent) if case[1] != 200 else case for case in FIND_BY_STATUS_CASES
+]
 
 
 @allure.feature("Pet")
 class TestPet:
-    @allure.title("Попытка удалить несуществующего питомца")
-    def test_delete_nonexistent_pet(self):
-        with allure.step("Отправка запроса на удаление несуществующего питомца"):
-            response = requests.delete(url=f"{BASE_URL}/pet/9999")
-
-        with allure.step("Проверка статуса ответа"):
-            assert response.status_code == 200, "Код ответа не совпал с ожидаемым"
-
-        with allure.step("Проверка текстового содержимого ответа"):
-            assert response.text == "Pet deleted", "Текстовое содержимое ответа не совпало с ожидаемым"
-
-    @allure.title("Попытка обновить несуществующего питомца")
-    def test_update_nonexistent_pet(self):
-        with allure.step("Отправка запроса на обновление несуществующего питомца"):
-            payload = {
-                "id": 9999,
-                "name": "Non-existent Pet",
-                "status": "available"
-            }
-            response = requests.put(f"{BASE_URL}/pet", json=payload)
-
-        with allure.step("Проверка статуса ответа"):
-            assert response.status_code == 404, "Код ответа не совпал с ожидаемым"
-
-        with allure.step("Проверка текстового содержимого ответа"):
-            assert response.text == "Pet not found", "Текстовое содержимое ответа не совпало с ожидаемым"
-
-    @allure.title("Попытка получить информацию о несуществующем питомце")
-    def test_get_information_about_a_nonexistent_pet(self):
-        with allure.step("Отправка запроса на получение информации о несуществующем питомце"):
-            response = requests.get(url=f"{BASE_URL}/pet/9999")
-
-        with allure.step("Проверка статуса ответа"):
-            assert response.status_code == 404, "Код ответа не совпадает с ожидаемым"
-
-        with allure.step("Проверка текстового содержимого ответа"):
-            assert response.text == "Pet not found", "Текстовое содержимое ответа не совпало с ожидаемым"
-
-    @allure.title("Добавление нового питомца")
-    def test_add_pet(self):
-        with allure.step("Подготовка данных для создания питомца"):
-            payload = {
-                "id": 1,
-                "name": "Buddy",
-                "status": "available"
-            }
-
-        with allure.step("Отправка запроса на создание питомца"):
-            response = requests.post(f"{BASE_URL}/pet", json=payload)
-            response_json = response.json()
-
-        with allure.step("Проверка статуса ответа и валидация json-схемы"):
-            assert response.status_code == 200, "Код ответа не совпал с ожидаемым"
-            jsonschema.validate(response_json, PET_SCHEMA)
-
-        with allure.step("Проверка параметров питомца в ответе"):
-            assert response_json['id'] == payload['id'], "id ответа не совпадает с ожидаемым"
-            assert response_json['name'] == payload['name'], "name ответа не совпадает с ожидаемым"
-            assert response_json['status'] == payload['status'], "status ответа не совпадает с ожидаемым"
-
-    @allure.title("Добавление нового питомца c полными данными")
-    def test_add_pet_with_complete_data(self):
-        with allure.step("Подготовка данных для создания питомца"):
-            payload = {
-                "id": 10,
-                "name": "doggie",
-                "category": {
-                    "id": 1,
-                    "name": "Dogs"
-                },
-                "photoUrls": [
-                    "string"
-                ],
-                "tags": [
-                    {
-                        "id": 0,
-                        "name": "string"
-                    }
-                ],
-                "status": "available"
-            }
-
-        with allure.step("Отправка запроса на создание питомца"):
-            response = requests.post(f"{BASE_URL}/pet", json=payload)
-            response_json = response.json()
-
-        with allure.step("Проверка статуса ответа и валидация json-схемы"):
-            assert response.status_code == 200, "Код ответа не совпал с ожидаемым"
-            jsonschema.validate(response_json, PET_SCHEMA)
-
-        with allure.step("Проверка параметров питомца в ответе"):
-            assert response_json['id'] == payload['id'], "id ответа не совпадает с ожидаемым"
-            assert response_json['name'] == payload['name'], "name ответа не совпадает с ожидаемым"
-            assert response_json['category'] == payload['category'], "category ответа не совпадает с ожидаемым"
-            assert response_json['photoUrls'] == payload['photoUrls'], "photoUrls ответа не совпадают с ожидаемыми"
-            assert response_json['tags'] == payload['tags'], "tags ответа не совпадают с ожидаемыми"
-            assert response_json['status'] == payload['status'], "status ответа не совпадает с ожидаемым"
-
     @allure.title("Получение информации о питомце по ID")
-    def test_get_pet_by_id(self, create_pet):
+    @pytest.mark.uses_resource("pet", "read")
+    @pytest.mark.latency_slo(2000)
+    def test_get_pet_by_id(self, api_client, shared_pet):
         with allure.step("Получение ID созданного питомца"):
-            pet_id = create_pet["id"]
+            pet_id = shared_pet["id"]
 
         with allure.step("Отправка запроса на получение информации о питомце по ID"):
-            response = requests.get(f"{BASE_URL}/pet/{pet_id}")
+            response = api_client.get(f"/pet/{pet_id}")
 
         with allure.step("Проверка статуса ответа и данных питомца"):
             assert response.status_code == 200, "Код ответа не совпал с ожидаемым"
             assert response.json()["id"] == pet_id
 
     @allure.title("Обновление информации о питомце")
-    def test_update_information_by_pet(self, create_pet):
+    @pytest.mark.uses_resource("pet", "write")
+    def test_update_information_by_pet(self, api_client, shared_pet):
         with allure.step("Получение ID созданного питомца"):
-            pet_id = create_pet["id"]
-
-        with allure.step("Отправка запроса на получение информации о питомце по ID"):
-            response = requests.get(f"{BASE_URL}/pet/{pet_id}")
-
-        with allure.step("Проверка статуса ответа и данных питомца"):
-            assert response.status_code == 200, "Код ответа не совпал с ожидаемым"
-            assert response.json()["id"] == pet_id
+            pet_id = shared_pet["id"]
 
         with allure.step("Подготовка данных для обновления питомца"):
             payload = {
@@ -141,53 +48,39 @@ class TestPet:
             }
 
         with allure.step("Отправка запроса на обновление питомца"):
-            response = requests.put(f"{BASE_URL}/pet", json=payload)
+            response = api_client.put("/pet", json=payload)
+            response_json = response.json()
 
         with allure.step("Проверка статуса ответа и данных обновленного питомца"):
             assert response.status_code == 200, "Код ответа не совпал с ожидаемым"
-            assert response.json()["id"] == pet_id, "id ответа не совпадает с ожидаемым"
-            assert response.json()["name"] == payload["name"], "Имя не обновилось"
-            assert response.json()["status"] == payload["status"], "Статус не обновился"
+            assert response_json["id"] == pet_id, "id ответа не совпадает с ожидаемым"
+            assert response_json["name"] == payload["name"], "Имя не обновилось"
+            assert response_json["status"] == payload["status"], "Статус не обновился"
 
     @allure.title("Удаление питомца по ID")
-    def test_delete_pet_by_ID(self, create_pet):
+    @pytest.mark.uses_resource("pet", "destroy")
+    def test_delete_pet_by_ID(self, api_client, shared_pet):
         with allure.step("Получение ID созданного питомца"):
-            pet_id = create_pet["id"]
-
-        with allure.step("Отправка запроса на получение информации о питомце по ID"):
-            response = requests.get(f"{BASE_URL}/pet/{pet_id}")
-
-        with allure.step("Проверка статуса ответа и данных питомца"):
-            assert response.status_code == 200, "Код ответа не совпал с ожидаемым"
-            assert response.json()["id"] == pet_id
+            pet_id = shared_pet["id"]
 
         with allure.step("Отправка запроса на удаление питомца по ID"):
-            response = requests.delete(url=f"{BASE_URL}/pet/{pet_id}")
+            response = api_client.delete(f"/pet/{pet_id}")
 
         with allure.step("Проверка статуса ответа"):
             assert response.status_code == 200, "Код ответа не совпал с ожидаемым"
 
         with allure.step("Отправка запроса на получение информации о питомце по ID"):
-            response = requests.get(f"{BASE_URL}/pet/{pet_id}")
+            response = api_client.get(f"/pet/{pet_id}")
 
         with allure.step("Проверка статуса ответа"):
             assert response.status_code == 404, "Код ответа не совпал с ожидаемым"
 
 
     @allure.title("Получение списка питомцев по статусу")
-    @pytest.mark.parametrize(
-        "status, expected_status_code, expected_error_message",
-        [
-            ("available", 200, None),  # Корректный статус
-            ("pending", 200, None),  # Корректный статус
-            ("sold", 200, None),  # Корректный статус
-            (None, 400, "No status provided. Try again?"),  # Пустой статус
-            ("new", 400, "Input error: query parameter `status value `new` is not in the allowable values `[available, pending, sold]`"),  # Некорректный статус
-        ]
-    )
-    def test_get_pets_by_status(self, status, expected_status_code, expected_error_message):
+    @pytest.mark.parametrize("status, expected_status_code, expected_error_message", FIND_BY_STATUS_PARAMS)
+    def test_get_pets_by_status(self, api_client, status, expected_status_code, expected_error_message):
         with allure.step(f"Отправка запроса на получение питомцев по статусу {status}"):
-            response = requests.get(f"{BASE_URL}/pet/findByStatus", params={"status": status})
+            response = api_client.get("/pet/findByStatus", params={"status": status}, stream=True)
 
         with allure.step("Проверка статуса ответа"):
             assert response.status_code == expected_status_code, "Статус отличается от ожидаемого"
@@ -205,5 +98,7 @@ class TestPet:
                 # Проверяем, что текст ошибки соответствует ожидаемому
                 assert error_message == expected_error_message, "Текст ошибки не совпал с ожидаемым"
             else:
-                # Если ошибки нет, проверяем, что ответ содержит список питомцев
-                assert isinstance(response.json(), list), "Ответ должен быть списком питомцев"
\ No newline at end of file
+                # Если ошибки нет, проверяем, что ответ содержит список питомцев. Питомцы разбираются
+                # и валидируются по мере получения ответа, так что тест падает на первом невалидном
+                with response:
+                    validate_many("pet", iter_json_array(response.iter_content(chunk_size=STREAM_CHUNK_SIZE)))
\ No newline at end of file
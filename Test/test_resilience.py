@@ -0,0 +1,102 @@
+import time
+
+import allure
+import pytest
+import requests
+
+from .api.client import ApiClient
+from .api.resources import pet_payload
+
+
+def proxied_client(fault_proxy, request_log, cleanup, **kwargs):
+    """HTTP-клиент, работающий через прокси с неисправностями и пишущий запросы в журнал теста"""
+    client = request_log.attach(ApiClient(fault_proxy.base_url, backoff_factor=0, **kwargs))
+    cleanup.callback(client.close)
+    return client
+
+
+@allure.feature("Resilience")
+class TestResilience:
+    @allure.title("Прерывание запроса по таймауту при медленном ответе API")
+    def test_client_timeout_on_slow_endpoint(self, fault_proxy, faults, request_log, cleanup):
+        with allure.step("Задержка ответа на получение питомца дольше таймаута клиента"):
+            faults(endpoint="GET /pet/{id}", latency_ms=1000)
+            client = proxied_client(fault_proxy, request_log, cleanup, retries=1, timeout=0.2)
+
+        with allure.step("Отправка запроса и проверка, что клиент прерывает его по таймауту"):
+            start = time.perf_counter()
+            with pytest.raises(requests.exceptions.ConnectionError, match="Read timed out"):
+                client.get("/pet/9999")
+            elapsed = time.perf_counter() - start
+
+        with allure.step("Проверка, что ожидание ограничено таймаутом с учётом повтора"):
+            assert elapsed < 0.2 * 2 + 0.5, f"Запрос ждал {elapsed:.2f} с вместо таймаута клиента"
+
+    @allure.title("Восстановление после ответов 503 за счёт повторов")
+    @pytest.mark.max_retries(2)
+    def test_retry_recovers_from_server_errors(self, fault_proxy, faults, request_log, cleanup):
+        with allure.step("Ответ 503 на два первых запроса питомца"):
+            rule = faults(endpoint="GET /pet/{id}", fault="error", status=503, times=2)
+            client = proxied_client(fault_proxy, request_log, cleanup, retries=3)
+
+        with allure.step("Отправка запроса на получение информации о несуществующем питомце"):
+            response = client.get("/pet/9999")
+
+        with allure.step("Проверка, что ответ API получен после двух повторов"):
+            assert response.status_code == 404, "Код ответа не совпал с ожидаемым"
+            assert rule.applied == 2, "Прокси внедрил не то количество ошибок"
+            assert request_log.retries == 2, "Количество повторов клиента не совпало с ожидаемым"
+
+    @allure.title("Восстановление после разрыва соединения за счёт повтора")
+    @pytest.mark.max_retries(1)
+    def test_retry_recovers_from_connection_reset(self, fault_proxy, faults, request_log, cleanup):
+        with allure.step("Разрыв соединения на первом запросе инвентаря"):
+            faults(endpoint="GET /store/inventory", fault="reset", times=1)
+            client = proxied_client(fault_proxy, request_log, cleanup, retries=1)
+
+        with allure.step("Отправка запроса на получение инвентаря магазина"):
+            response = client.get("/store/inventory")
+
+        with allure.step("Проверка статуса ответа"):
+            assert response.status_code == 200, "Код ответа не совпал с ожидаемым"
+
+    @allure.title("Ответ 503 после исчерпания повторов")
+    def test_retries_exhausted_on_persistent_errors(self, fault_proxy, faults, request_log, cleanup):
+        with allure.step("Ответ 503 на все запросы питомца"):
+            rule = faults(endpoint="GET /pet/{id}", fault="error", status=503)
+            client = proxied_client(fault_proxy, request_log, cleanup, retries=2)
+
+        with allure.step("Отправка запроса на получение информации о питомце"):
+            response = client.get("/pet/9999")
+
+        with allure.step("Проверка, что клиент вернул последний ответ после всех повторов"):
+            assert response.status_code == 503, "Код ответа не совпал с ожидаемым"
+            assert rule.applied == 3, "Количество попыток не совпало с ожидаемым"
+
+    @allure.title("Создание питомца не повторяется при ответе 503")
+    @pytest.mark.max_retries(0)
+    def test_post_is_not_retried(self, fault_proxy, faults, request_log, cleanup, new_pet_id):
+        with allure.step("Ответ 503 на первый запрос создания питомца"):
+            rule = faults(endpoint="POST /pet", fault="error", status=503, times=1)
+            client = proxied_client(fault_proxy, request_log, cleanup, retries=3)
+
+        with allure.step("Отправка запроса на создание питомца"):
+            response = client.post("/pet", json=pet_payload(new_pet_id))
+
+        with allure.step("Проверка, что неидемпотентный запрос не повторялся"):
+            assert response.status_code == 503, "Код ответа не совпал с ожидаемым"
+            assert rule.matched == 1, "Запрос создания питомца был повторён"
+
+    @allure.title("Соблюдение SLO по задержке при медленном API")
+    @pytest.mark.latency_slo(2000)
+    def test_latency_within_slo(self, fault_proxy, faults, request_log, cleanup):
+        with allure.step("Задержка 100-150 мс на запросы инвентаря"):
+            faults(endpoint="GET /store/inventory", latency_ms=100, jitter_ms=50)
+            client = proxied_client(fault_proxy, request_log, cleanup)
+
+        with allure.step("Отправка запроса на получение инвентаря магазина"):
+            response = client.get("/store/inventory")
+
+        with allure.step("Проверка статуса ответа и того, что задержка прокси учтена"):
+            assert response.status_code == 200, "Код ответа не совпал с ожидаемым"
+            assert request_log.entries[-1]["total_ms"] >= 100, "Задержка прокси не применилась"
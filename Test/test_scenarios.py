@@ -0,0 +1,18 @@
+import allure
+import pytest
+
+from .scenarios.engine import ScenarioRunner, load_scenarios, required_fixtures, scenario_marks
+
+SCENARIOS = load_scenarios()
+
+
+@pytest.mark.parametrize(
+    "scenario",
+    [pytest.param(scenario, id=scenario["name"], marks=scenario_marks(scenario)) for scenario in SCENARIOS]
+)
+def test_scenario(request, api_client, scenario):
+    if "feature" in scenario:
+        allure.dynamic.feature(scenario["feature"])
+    allure.dynamic.title(scenario.get("title", scenario["name"]))
+    fixtures = {name: request.getfixturevalue(name) for name in required_fixtures(scenario)}
+    ScenarioRunner(api_client).run(scenario, fixtures)
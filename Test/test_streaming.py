@@ -0,0 +1,78 @@
+import json
+
+import allure
+import pytest
+from jsonschema.exceptions import ValidationError
+
+from .api.streaming import iter_json_array
+from .schemas.registry import validate_many
+
+# Питомцы с многобайтовыми символами UTF-8 и escape-последовательностями
+PETS = [
+    {"id": index, "name": f"Бадди 😀 \"{index}\"", "photoUrls": ["\\u00e9"], "status": "available",
+     "tags": [{"id": -index, "name": "é"}]}
+    for index in range(1, 30)
+]
+# Числа с дробной частью и экспонентой и литералы, которые граница куска может разрезать посередине
+DOCUMENT = PETS + [1.5e-3, -42, 0.25, True, False, None, [[]], {}]
+# Кусков после некорректного элемента: парсер не должен дочитывать их до конца тела
+TAIL_CHUNKS = 2000
+
+
+def split(body, size):
+    return [body[start:start + size] for start in range(0, len(body), size)]
+
+
+class ChunkCounter:
+    """Куски тела ответа с подсчётом того, сколько из них прочитано"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.consumed = 0
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+
+
+def body_with_tail(head):
+    """Тело: head, затем TAIL_CHUNKS корректных питомцев по одному на кусок"""
+    pet = json.dumps(PETS[0]).encode()
+    return ChunkCounter([head] + [b"," + pet] * TAIL_CHUNKS + [b"]"])
+
+
+@allure.feature("Streaming")
+class TestStreaming:
+    @allure.title("Разбор JSON-массива, разрезанного на куски произвольного размера")
+    @pytest.mark.parametrize("ensure_ascii", [True, False], ids=["escaped", "utf-8"])
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 64])
+    def test_split_chunks(self, size, ensure_ascii):
+        with allure.step(f"Разбиение тела ответа на куски по {size} байт"):
+            chunks = split(json.dumps(DOCUMENT, ensure_ascii=ensure_ascii).encode(), size)
+
+        with allure.step("Проверка разобранных элементов"):
+            assert list(iter_json_array(chunks)) == DOCUMENT, "Элементы не совпали с исходными"
+
+    @allure.title("Ошибка на некорректном элементе без чтения остатка ответа")
+    @pytest.mark.parametrize("element", [b'{"id":2,,}', b'{"id":nul}', b'{"name":"\\u00zz"}', b'{"id":1}{"id":2}'])
+    def test_malformed_element_fails_fast(self, element):
+        with allure.step("Подготовка тела с некорректным вторым элементом"):
+            chunks = body_with_tail(b'[{"id":1},' + element)
+
+        with allure.step("Проверка ошибки разбора"):
+            with pytest.raises(ValueError):
+                list(iter_json_array(chunks))
+            assert chunks.consumed <= 2, f"Прочитано {chunks.consumed} кусков из {TAIL_CHUNKS + 2}"
+
+    @allure.title("Ошибка валидации элемента без чтения остатка ответа")
+    def test_schema_invalid_element_fails_fast(self):
+        with allure.step("Подготовка тела с питомцем без обязательного поля name"):
+            invalid = {key: value for key, value in PETS[1].items() if key != "name"}
+            chunks = body_with_tail(b"[" + json.dumps(PETS[0]).encode() + b"," + json.dumps(invalid).encode())
+
+        with allure.step("Проверка ошибки валидации"):
+            with pytest.raises(ValidationError) as error:
+                validate_many("pet", iter_json_array(chunks))
+            assert list(error.value.path) == [1], "Ошибка относится не ко второму элементу"
+            assert chunks.consumed <= 2, f"Прочитано {chunks.consumed} кусков из {TAIL_CHUNKS + 2}"
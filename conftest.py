@@ -0,0 +1,3 @@
+# Опции и плагины регистрируются из корневого conftest.py: он загружается до разбора командной строки
+# и при запуске без путей, и с "--base-url URL", где значение иначе принимается за путь к тестам
+pytest_plugins = ["Test.plugin"]